@@ -6,10 +6,11 @@ the new variable name is shorter the more often it is used.
 
 from __future__ import annotations
 from dataclasses import dataclass
-from collections.abc import Generator
+from collections import defaultdict
+from collections.abc import Callable
 from string import ascii_letters, digits
-from functools import singledispatchmethod
-from typing import Self
+from itertools import repeat
+from typing import Any, Self
 
 from lua.graph import TreeNode
 from lua.lua_ast import (
@@ -18,12 +19,8 @@ from lua.lua_ast import (
     # functions stuff
     FuncBodyNode,
     # data nodes
-    DataNode,
     ExpNode,
     TableConstrNode,
-    FieldNode,
-    BinOpNode,
-    UnOpNode,
     FuncDefNode,
     PrefExpNode,
     # prefexpnode extractors
@@ -49,44 +46,47 @@ from lua.lua_ast import (
     RetNode,
 )
 
-_RESERVED_GLOBAL_NAMES = {
-    # global libs
-    "math",
-    "table",
-    "string",
-    # global functions
-    "pairs",
-    "ipairs",
-    "next",
-    "tostring",
-    "tonumber",
-    "type",
-    # stormworks specific
-    "async",
-    "onTick",
-    "onDraw",
-    "input",
-    "output",
-    "screen",
-    "property",
-    "map",
-}
-
-
-def _name_generator() -> Generator[str, None, None]:
-    """creates string iterator that return valid short lua names for variables"""
-
-    letters = ascii_letters + "_"
-    alph = letters + digits
-    first_len = len(letters)
-    alph_len = len(alph)
-    res = [
-        0,
-    ]
+_RESERVED_GLOBAL_NAMES = frozenset(
+    {
+        # global libs
+        "math",
+        "table",
+        "string",
+        # global functions
+        "pairs",
+        "ipairs",
+        "next",
+        "tostring",
+        "tonumber",
+        "type",
+        # stormworks specific
+        "async",
+        "onTick",
+        "onDraw",
+        "input",
+        "output",
+        "screen",
+        "property",
+        "map",
+    }
+)
+
 
-    yield letters[0]
+def _generate_names(count: int) -> list[str]:
+    """creates list of count valid short lua names for variables"""
 
-    while True:
+    letters = bytes(ascii_letters + "_", "ascii")
+    alph = letters + bytes(digits, "ascii")
+    first_len = len(letters)
+    alph_len = len(alph)
+    # res holds alphabet indices of name symbols, out holds the symbols
+    # so only the changed positions of out are rewritten on each step
+    res = bytearray(1)
+    out = bytearray(letters[:1])
+    names: list[str] = []
+
+    for _ in range(count):
+        names.append(out.decode("ascii"))
         res[0] += 1
 
         if res[0] == first_len:
@@ -97,26 +97,29 @@ def _name_generator() -> Generator[str, None, None]:
 
                 if res[i] == alph_len:
                     res[i] = 0
+                    out[i] = alph[0]
                 else:
+                    out[i] = alph[res[i]]
                     break
 
             else:
                 res.append(1)
+                out.append(alph[1])
+
+        out[0] = letters[res[0]]
 
-        yield "".join([alph[ind] for ind in res])
+    return names
 
 
-@dataclass
+@dataclass(slots=True)
 class _ScopeNode(TreeNode):
     """
     node scope tree, each node contains name table
     name table - dict[variable_name, list[all its uses (ast name_nodes)]]
     """
 
-    __slots__ = "successors", "name_table"
-
     successors: list[_ScopeNode]
-    name_table: dict[str, list[NameNode]]
+    name_table: defaultdict[str, list[NameNode]]
 
     def descendants(self):
         return reversed(self.successors)
@@ -128,29 +131,130 @@ class _ScopeNode(TreeNode):
             yield k + "\tuses:\t" + str(len(v))
 
 
+_Handler = Callable[[Any, Any], None]
+
+
+def _resolve_handler(
+    dispatch: dict[type[AstNode], _Handler], node_type: type[AstNode]
+) -> _Handler | None:
+    """find handler registered for the closest class in node_type mro"""
+
+    for t in node_type.__mro__:
+        if (handler := dispatch.get(t)) is not None:
+            return handler
+
+    return None
+
+
+# statements that add names to the scope of the block they are in
+_LOCAL_DECLARATION_NODES = (LocalVarsAssignNode, LocalFuncAssignNode, LabelNode)
+
+
+def _block_declares_locals(node: BlockNode) -> bool:
+    """check whether block needs its own scope"""
+
+    return any(
+        isinstance(statement, _LOCAL_DECLARATION_NODES)
+        for statement in node.statement_node_list
+    )
+
+
+# _ScopeTreeBuilder work stack operations
+_ENTER_SCOPE = 0
+_LEAVE_SCOPE = 1
+_ADD_LOCAL_NAME_USES = 2
+_PROCESS_EXP = 3
+_PROCESS_STATEMENT = 4
+
+_WorkItem = tuple[int, Any]
+
+
 class _ScopeTreeBuilder:
-    """builds scope tree"""
+    """builds scope tree
 
-    __slots__ = ("__nodes_stack",)
+    ast is walked without recursion: handlers do what they can right away
+    and push the rest of the work to the work stack as (operation, payload)
+    items, so everything pushed is done in reversed order of pushing
+    """
+
+    __slots__ = "__nodes_stack", "__work_stack"
 
     def __init__(self) -> None:
         # node on top of stack represents global scope
         self.__nodes_stack: list[_ScopeNode] = [
-            _ScopeNode([], {}),
+            _ScopeNode([], defaultdict(list)),
         ]
+        self.__work_stack: list[_WorkItem] = []
 
-    def build_tree(self, root: BlockNode) -> _ScopeNode:
+    def build_tree(self, root: ChunkNode) -> _ScopeNode:
         """returns scope tree root node"""
 
-        self._process_chunk_node(root)
+        self._push_block_node(root.block_node)
+        self._process_work_stack()
 
         return self.__nodes_stack[0]
 
+    def _process_work_stack(self) -> None:
+        """pops and performs operations from work stack until it is empty"""
+
+        work = self.__work_stack
+        pop = work.pop
+        exp_cache = self._EXP_DISPATCH_CACHE
+        statement_cache = self._STATEMENT_DISPATCH_CACHE
+
+        while work:
+            op, payload = pop()
+
+            if op == _PROCESS_EXP:
+                try:
+                    handler = exp_cache[type(payload)]
+                except KeyError:
+                    handler = exp_cache[type(payload)] = self._resolve_exp_handler(
+                        type(payload)
+                    )
+
+                if handler is not None:
+                    handler(self, payload)
+
+            elif op == _PROCESS_STATEMENT:
+                try:
+                    handler = statement_cache[type(payload)]
+                except KeyError:
+                    handler = statement_cache[type(payload)] = _resolve_handler(
+                        self._STATEMENT_DISPATCH, type(payload)
+                    )
+
+                if handler is not None:
+                    handler(self, payload)
+
+            elif op == _ADD_LOCAL_NAME_USES:
+                self._add_local_name_uses(payload)
+
+            elif op == _ENTER_SCOPE:
+                self._enter_new_scope()
+
+            else:
+                self._leave_scope()
+
+    @classmethod
+    def _resolve_exp_handler(cls, node_type: type[AstNode]) -> _Handler | None:
+        """nodes without registered handler are walked through their descendants,
+        nodes that have no descendants at all need no processing
+        """
+
+        if (handler := _resolve_handler(cls._EXP_DISPATCH, node_type)) is not None:
+            return handler
+
+        if node_type.descendants is TreeNode.descendants:
+            return None
+
+        return cls._push_descendants
+
     def _enter_new_scope(self) -> None:
         """appends new scope node to stack"""
 
         stack = self.__nodes_stack
-        new_scope_node = _ScopeNode([], {})
+        new_scope_node = _ScopeNode([], defaultdict(list))
         stack[-1].successors.append(new_scope_node)
         stack.append(new_scope_node)
 
@@ -161,234 +265,254 @@ class _ScopeTreeBuilder:
     def _add_local_name_use(self, name_node: NameNode) -> None:
         """adds name use entry to current (top of dfs stack) scope"""
 
-        target = name_node.name
-        name_table = self.__nodes_stack[-1].name_table
-
-        if (u := name_table.get(target)) is not None:
-            u.append(name_node)
-        else:
-            name_table[target] = [
-                name_node,
-            ]
+        self.__nodes_stack[-1].name_table[name_node.name].append(name_node)
 
     def _add_local_name_uses(self, name_node_list: list[NameNode]) -> None:
         """process list of local name nodes"""
 
-        for name in name_node_list:
-            self._add_local_name_use(name)
+        name_table = self.__nodes_stack[-1].name_table
+
+        for name_node in name_node_list:
+            name_table[name_node.name].append(name_node)
 
     def _add_name_use(self, name_node: NameNode) -> None:
         """traverses scope graph up to global namespace to insert name use entry"""
 
         target = name_node.name
         stack = self.__nodes_stack
+        i = len(stack)
 
-        for scope_node in reversed(stack):
-            if (u := scope_node.name_table.get(target)) is not None:
+        while i:
+            i -= 1
+
+            if (u := stack[i].name_table.get(target)) is not None:
                 u.append(name_node)
                 return
 
         if target not in _RESERVED_GLOBAL_NAMES:
-            stack[0].name_table[target] = [
-                name_node,
-            ]
+            stack[0].name_table[target].append(name_node)
 
-    # function stuff
+    # work stack filling
 
-    def _process_funcbody_node(self, node: FuncBodyNode) -> None:
-        """process funcbody node that can emerge during both block and datanode processings"""
+    def _push_exp_node(self, node: ExpNode) -> None:
+        """push exp node processing"""
+        self.__work_stack.append((_PROCESS_EXP, node.data_node))
 
-        self._enter_new_scope()
+    def _push_exp_list(self, exp_node_list: list[ExpNode]) -> None:
+        """push processing of list of exp nodes"""
 
-        for name_node in node.name_node_list:
-            self._add_local_name_use(name_node)
+        self.__work_stack.extend(
+            [(_PROCESS_EXP, exp.data_node) for exp in reversed(exp_node_list)]
+        )
 
-        self._process_block_node(node.block_node)
-        self._leave_scope()
+    def _push_descendants(self, node: AstNode) -> None:
+        """push processing of all node descendants as expressions"""
 
-    def _process_funcgetter_node(self, node: FuncGetterNode) -> None:
-        """process a call to a function"""
-        arg = node.arg
+        self.__work_stack.extend(zip(repeat(_PROCESS_EXP), node.descendants()))
 
-        if isinstance(arg, list):
-            self._process_exp_list(arg)
-        else:
-            self._process_exp_subtree(arg)
+    def _push_block_node(self, node: BlockNode) -> None:
+        """push processing of each statement in block"""
 
-    def _process_exp_list(self, exp_node_list: list[ExpNode]) -> None:
-        """process list of exp nodes"""
+        self.__work_stack.extend(
+            [
+                (_PROCESS_STATEMENT, statement)
+                for statement in reversed(node.statement_node_list)
+            ]
+        )
 
-        for exp in exp_node_list:
-            self._process_exp_subtree(exp.data_node)
+    def _push_scoped_block_node(self, node: BlockNode) -> None:
+        """push processing of block inside its own scope,
+        scope is omitted if block declares no local names
+        """
 
-    def _process_exp_node(self, node: ExpNode):
-        """process exp node"""
-        self._process_exp_subtree(node.data_node)
+        if not _block_declares_locals(node):
+            self._push_block_node(node)
+            return
 
-    # expression processing
-    @singledispatchmethod
-    def _process_exp_subtree(self, arg: DataNode) -> None:
-        """process data nodes in expression tree to find all used variable names"""
+        work = self.__work_stack
+        work.append((_LEAVE_SCOPE, None))
+        self._push_block_node(node)
+        work.append((_ENTER_SCOPE, None))
 
-    @_process_exp_subtree.register(PrefExpNode)
-    def _(self, node: PrefExpNode):
-        v = node.var_node
+    def _push_funcgetter_node(self, node: FuncGetterNode) -> None:
+        """push processing of a call to a function"""
+        arg = node.arg
 
-        if isinstance(v, NameNode):
-            self._add_name_use(v)
+        if isinstance(arg, list):
+            self._push_exp_list(arg)
         else:
-            self._process_exp_node(v)
+            self.__work_stack.append((_PROCESS_EXP, arg))
 
-        for ext in node.extractor_node_list:
-            match ext:
-                case FuncGetterNode():
-                    self._process_funcgetter_node(ext)
+    # function stuff
 
-                case TableGetterNode(field_node=ExpNode() as f):
-                    self._process_exp_node(f)
+    def _process_funcbody_node(self, node: FuncBodyNode) -> None:
+        """process funcbody node that can emerge during both block and datanode processings"""
 
-                case MethodGetterNode():
-                    self._process_funcgetter_node(ext.funcgetter_node)
+        self._enter_new_scope()
+        self._add_local_name_uses(node.name_node_list)
+        self.__work_stack.append((_LEAVE_SCOPE, None))
+        self._push_block_node(node.block_node)
 
-    @_process_exp_subtree.register(FuncDefNode)
-    def _(self, node: FuncDefNode):
-        self._process_funcbody_node(node.funcbody_node)
+    # expression processing
 
-    @_process_exp_subtree.register(BinOpNode)
-    def _(self, node: BinOpNode):
-        self._process_exp_subtree(node.left_operand_node)
-        self._process_exp_subtree(node.right_operand_node)
+    def _process_prefexp_node(self, node: PrefExpNode) -> None:
+        work = self.__work_stack
+        push_funcgetter_node = self._push_funcgetter_node
 
-    @_process_exp_subtree.register(UnOpNode)
-    def _(self, node: UnOpNode):
-        self._process_exp_subtree(node.right_operand_node)
+        for ext in reversed(node.extractor_node_list):
+            if isinstance(ext, FuncGetterNode):
+                push_funcgetter_node(ext)
 
-    @_process_exp_subtree.register(TableConstrNode)
-    def _(self, node: TableConstrNode):
-        for field in node.field_node_list:
-            i_node = field.index_node
+            elif isinstance(ext, TableGetterNode):
+                if isinstance(f := ext.field_node, ExpNode):
+                    work.append((_PROCESS_EXP, f.data_node))
 
-            if isinstance(i_node, ExpNode):
-                self._process_exp_node(i_node)
+            elif isinstance(ext, MethodGetterNode):
+                push_funcgetter_node(ext.funcgetter_node)
 
-            self._process_exp_node(field.exp_node)
+        v = node.var_node
 
-    # statement processing
-    def _process_chunk_node(self, node: ChunkNode) -> None:
-        """process chunk node"""
+        if isinstance(v, NameNode):
+            self._add_name_use(v)
+        else:
+            work.append((_PROCESS_EXP, v.data_node))
 
-        self._process_block_node(node.block_node)
+    def _process_funcdef_node(self, node: FuncDefNode) -> None:
+        self._process_funcbody_node(node.funcbody_node)
 
-    def _process_block_node(self, node: BlockNode) -> None:
-        """process block node by processing each statement in it"""
+    def _process_tableconstr_node(self, node: TableConstrNode) -> None:
+        # big tables are common so field and exp nodes are skipped right here
+        work = self.__work_stack
 
-        for statement in node.statement_node_list:
-            self._process_statement_node(statement)
+        for field in reversed(node.field_node_list):
+            work.append((_PROCESS_EXP, field.exp_node.data_node))
 
-    @singledispatchmethod
-    def _process_statement_node(self, arg: AstNode) -> None:
-        """process statement node according to its type"""
+            if isinstance(i_node := field.index_node, ExpNode):
+                work.append((_PROCESS_EXP, i_node.data_node))
 
-    @_process_statement_node.register(VarsAssignNode)
-    def _(self, node: VarsAssignNode):
-        for prefexp_node in node.var_node_list:
-            self._process_exp_subtree(prefexp_node)
+    # statement processing
 
-        self._process_exp_list(node.exp_node_list)
+    def _process_varsassign_node(self, node: VarsAssignNode) -> None:
+        self._push_exp_list(node.exp_node_list)
+        self.__work_stack.extend(
+            [
+                (_PROCESS_EXP, prefexp_node)
+                for prefexp_node in reversed(node.var_node_list)
+            ]
+        )
 
-    @_process_statement_node.register(FuncCallNode)
-    def _(self, node: FuncCallNode):
-        self._process_exp_subtree(node)
+    def _process_funccall_node(self, node: FuncCallNode) -> None:
+        self._process_prefexp_node(node)
 
-    @_process_statement_node.register(LabelNode)
-    def _(self, node: LabelNode):
+    def _process_label_node(self, node: LabelNode) -> None:
         self._add_local_name_use(node.name_node)
 
-    @_process_statement_node.register(GotoNode)
-    def _(self, node: GotoNode):
+    def _process_goto_node(self, node: GotoNode) -> None:
         self._add_name_use(node.name_node)
 
-    @_process_statement_node.register(DoBlockNode)
-    def _(self, node: DoBlockNode):
-        self._enter_new_scope()
-        self._process_block_node(node.block_node)
-        self._leave_scope()
+    def _process_doblock_node(self, node: DoBlockNode) -> None:
+        self._push_scoped_block_node(node.block_node)
 
-    @_process_statement_node.register(WhileLoopNode)
-    def _(self, node: WhileLoopNode):
-        self._process_exp_node(node.exp_node)
-        self._enter_new_scope()
-        self._process_block_node(node.block_node)
-        self._leave_scope()
-
-    @_process_statement_node.register(RepeatLoopNode)
-    def _(self, node: RepeatLoopNode):
-        self._enter_new_scope()
-        self._process_block_node(node.block_node)
-        self._process_exp_node(node.exp_node)
-        self._leave_scope()
+    def _process_whileloop_node(self, node: WhileLoopNode) -> None:
+        self._push_scoped_block_node(node.block_node)
+        self._push_exp_node(node.exp_node)
 
-    @_process_statement_node.register(IfNode)
-    def _(self, node: IfNode):
-        # work on if
-        (block, exp) = node.block_exp
-        self._process_exp_node(exp)
-        self._enter_new_scope()
-        self._process_block_node(block)
-        self._leave_scope()
-
-        # work on elseif
-        for block, exp in node.block_exp_list:
-            self._process_exp_node(exp)
+    def _process_repeatloop_node(self, node: RepeatLoopNode) -> None:
+        # until expression can see block locals so it is processed in block scope
+        if _block_declares_locals(node.block_node):
             self._enter_new_scope()
-            self._process_block_node(block)
-            self._leave_scope()
+            self.__work_stack.append((_LEAVE_SCOPE, None))
+
+        self._push_exp_node(node.exp_node)
+        self._push_block_node(node.block_node)
 
+    def _process_if_node(self, node: IfNode) -> None:
         # work on else
         if (else_block := node.else_block_node) is not None:
-            self._enter_new_scope()
-            self._process_block_node(else_block)
-            self._leave_scope()
+            self._push_scoped_block_node(else_block)
+
+        # work on elseif
+        for block, exp in reversed(node.block_exp_list):
+            self._push_scoped_block_node(block)
+            self._push_exp_node(exp)
+
+        # work on if
+        (block, exp) = node.block_exp
+        self._push_scoped_block_node(block)
+        self._push_exp_node(exp)
 
-    @_process_statement_node.register(ForLoopNode)
-    def _(self, node: ForLoopNode):
-        self._process_exp_node(node.assign_exp_node)
-        self._process_exp_node(node.cond_exp_node)
+    def _process_forloop_node(self, node: ForLoopNode) -> None:
+        work = self.__work_stack
+        work.append((_LEAVE_SCOPE, None))
+        self._push_block_node(node.block_node)
+        work.append((_ADD_LOCAL_NAME_USES, (node.name_node,)))
+        work.append((_ENTER_SCOPE, None))
 
         if (i := node.iter_exp_node) is not None:
-            self._process_exp_node(i)
+            self._push_exp_node(i)
 
-        self._enter_new_scope()
-        self._add_local_name_use(node.name_node)
-        self._process_block_node(node.block_node)
-        self._leave_scope()
+        self._push_exp_node(node.cond_exp_node)
+        self._push_exp_node(node.assign_exp_node)
 
-    @_process_statement_node.register(ForIterLoopNode)
-    def _(self, node: ForIterLoopNode):
-        self._process_exp_list(node.exp_node_list)
-        self._enter_new_scope()
-        self._add_local_name_uses(node.name_node_list)
-        self._process_block_node(node.block_node)
-        self._leave_scope()
+    def _process_foriterloop_node(self, node: ForIterLoopNode) -> None:
+        work = self.__work_stack
+        work.append((_LEAVE_SCOPE, None))
+        self._push_block_node(node.block_node)
+        work.append((_ADD_LOCAL_NAME_USES, node.name_node_list))
+        work.append((_ENTER_SCOPE, None))
+        self._push_exp_list(node.exp_node_list)
 
-    @_process_statement_node.register(FuncAssignNode)
-    def _(self, node: FuncAssignNode):
+    def _process_funcassign_node(self, node: FuncAssignNode) -> None:
         self._add_name_use(node.funcname_node.name_node_list[0])
         self._process_funcbody_node(node.funcbody_node)
 
-    @_process_statement_node.register(LocalFuncAssignNode)
-    def _(self, node: LocalFuncAssignNode):
+    def _process_localfuncassign_node(self, node: LocalFuncAssignNode) -> None:
         self._add_local_name_use(node.name_node)
         self._process_funcbody_node(node.funcbody_node)
 
-    @_process_statement_node.register(LocalVarsAssignNode)
-    def _(self, node: LocalVarsAssignNode):
+    def _process_localvarsassign_node(self, node: LocalVarsAssignNode) -> None:
         self._add_local_name_uses(node.name_node_list)
-        self._process_exp_list(node.exp_node_list)
-
-    @_process_statement_node.register(RetNode)
-    def _(self, node: RetNode):
-        self._process_exp_list(node.exp_node_list)
+        self._push_exp_list(node.exp_node_list)
+
+    def _process_ret_node(self, node: RetNode) -> None:
+        self._push_exp_list(node.exp_node_list)
+
+    # node type: handler, node subclasses without their own entry
+    # are resolved through mro and memoized in the *_CACHE dicts
+
+    # only nodes that use names and table constructors need handlers,
+    # the others (operations...) are walked through descendants
+    _EXP_DISPATCH: dict[type[AstNode], _Handler] = {
+        PrefExpNode: _process_prefexp_node,
+        FuncDefNode: _process_funcdef_node,
+        TableConstrNode: _process_tableconstr_node,
+    }
+
+    _STATEMENT_DISPATCH: dict[type[AstNode], _Handler] = {
+        VarsAssignNode: _process_varsassign_node,
+        FuncCallNode: _process_funccall_node,
+        LabelNode: _process_label_node,
+        GotoNode: _process_goto_node,
+        DoBlockNode: _process_doblock_node,
+        WhileLoopNode: _process_whileloop_node,
+        RepeatLoopNode: _process_repeatloop_node,
+        IfNode: _process_if_node,
+        ForLoopNode: _process_forloop_node,
+        ForIterLoopNode: _process_foriterloop_node,
+        FuncAssignNode: _process_funcassign_node,
+        LocalFuncAssignNode: _process_localfuncassign_node,
+        LocalVarsAssignNode: _process_localvarsassign_node,
+        RetNode: _process_ret_node,
+    }
+
+    _EXP_DISPATCH_CACHE: dict[type[AstNode], _Handler | None] = {}
+    _STATEMENT_DISPATCH_CACHE: dict[type[AstNode], _Handler | None] = {}
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        # subclass may override handlers so it gets its own caches
+        cls._EXP_DISPATCH_CACHE = {}
+        cls._STATEMENT_DISPATCH_CACHE = {}
 
 
 class NamesStat:
@@ -406,8 +530,12 @@ class NamesStat:
     def optimize_names(self) -> None:
         """perform naming optimization on scope graph"""
 
-        main_list: list[list[NameNode]] = []
-        sub_list: list[list[NameNode]] = []
+        # names from different scopes of the same depth can share one new name,
+        # so each bucket holds name use lists of i-th most used names of every
+        # scope on some depth level and counts holds total number of uses
+        buckets: list[list[list[NameNode]]] = []
+        counts: list[int] = []
+        level_start = 0
 
         stack_2 = [
             self.root_node,
@@ -419,28 +547,26 @@ class NamesStat:
 
             while stack_1:
                 node = stack_1.pop()
-                h = list(node.name_table.values())
-                h.sort(key=len, reverse=True)
+                h = sorted(node.name_table.values(), key=len, reverse=True)
 
-                for i, v in enumerate(h):
-                    if i < len(sub_list):
-                        sub_list[i].extend(v)
+                for i, v in enumerate(h, level_start):
+                    if i < len(buckets):
+                        buckets[i].append(v)
+                        counts[i] += len(v)
                     else:
-                        sub_list.append(v)
-
-                stack_2.extend(node.descendants())
+                        buckets.append([v])
+                        counts.append(len(v))
 
-            main_list.extend(sub_list)
-            sub_list.clear()
+                stack_2.extend(node.successors)
 
-        main_list.sort(key=len, reverse=True)
-        name_gen = _name_generator()
+            level_start = len(buckets)
 
-        for name_node_list in main_list:
-            new_name = next(name_gen)
+        order = sorted(range(len(buckets)), key=counts.__getitem__, reverse=True)
 
-            for name_node in name_node_list:
-                name_node.name = new_name
+        for i, new_name in zip(order, _generate_names(len(order))):
+            for name_node_list in buckets[i]:
+                for name_node in name_node_list:
+                    name_node.name = new_name
 
     def show_tree(self):
         self.root_node.show()
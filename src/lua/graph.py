@@ -1,6 +1,5 @@
 from __future__ import annotations
-from collections.abc import Generator, Iterator
-from itertools import repeat
+from collections.abc import Generator, Iterable, Iterator
 
 
 class TreeNode:
@@ -8,20 +7,26 @@ class TreeNode:
 
     __slots__ = ()
 
-    def descendants(self) -> Iterator[TreeNode]:
+    def descendants(self) -> Iterable[TreeNode]:
         """should return descendants in reversed order"""
-        return iter(())
+        return ()
 
     def dfs(
         self,
     ) -> Generator[tuple[TreeNode, int, int, int], None, None]:
         """returns (node, depth, descendant number of node, number of node descendants)"""
-        stack: list[tuple[tuple[int, TreeNode], int]] = [((0, self), 0)]
+        stack: list[tuple[TreeNode, int, int]] = [(self, 0, 0)]
+        push = stack.append
         while stack:
-            (node_num, node), depth = stack.pop()
-            d = len(stack)
-            stack.extend(zip(enumerate(node.descendants()), repeat(depth + 1)))
-            yield node, depth, node_num, len(stack) - d
+            node, depth, node_num = stack.pop()
+            descendant_depth = depth + 1
+            descendant_num = 0
+
+            for descendant in node.descendants():
+                push((descendant, descendant_depth, descendant_num))
+                descendant_num += 1
+
+            yield node, depth, node_num, descendant_num
 
     def get_log_string(self) -> Iterator[str]:
         """get log string representation of node line by line"""
@@ -3,7 +3,7 @@ This module contains all parent classes for lua abstact syntax tree
 """
 
 from __future__ import annotations
-from collections.abc import Generator, Iterator
+from collections.abc import Iterable
 from enum import Enum, auto
 from typing import TypeVar
 
@@ -22,22 +22,32 @@ class AstNode(TreeNode):
     # simulate parse tree traversal
 
     # should return parse descendants in reversed order
-    def parse_tree_descendants(self) -> Iterator[AstNode | str]:
+    def parse_tree_descendants(self) -> Iterable[AstNode | str]:
         """should return parse descendants (nodes or strings) in reversed order"""
-        return iter(())
+        return ()
 
-    def terminals(self) -> Generator[str, None, None]:
-        """convert ast node to term iterator"""
+    def terminals(self) -> list[str]:
+        """convert ast node to term list"""
 
+        terms: list[str] = []
+        add_term = terms.append
         stack: list[AstNode | str] = [self]
+        pop = stack.pop
+        extend = stack.extend
+        # str is looked up once instead of per popped item
+        str_type = str
+
+        # explicit stack instead of recursive emit keeps deep
+        # expression chains away from recursion limit
         while stack:
-            str_or_node = stack.pop()
+            str_or_node = pop()
 
-            if isinstance(str_or_node, str):
-                yield str_or_node
-                continue
+            if type(str_or_node) is str_type:
+                add_term(str_or_node)
+            else:
+                extend(str_or_node.parse_tree_descendants())
 
-            stack.extend(str_or_node.parse_tree_descendants())
+        return terms
 
     def __repr__(self):
         return self.__class__.__name__
@@ -67,8 +77,8 @@ class DataNode(AstNode):
         VARARG = auto()
         RUNTIME_DEPEND = auto()
 
-    def __repr__(self):
-        return super().__repr__()
+    # type known before runtime, plain attribute so reads skip property calls
+    data_type: DataTypes = DataTypes.RUNTIME_DEPEND
 
 
 # Descendants of this node represents operations
@@ -78,26 +88,23 @@ class OperationNode(DataNode, Parsable):
     """descendants of this node represents operations"""
 
     _OPERATION_PRECEDENCE: dict[str, int] = {}
-    _RIGHT_ASSOC_OPERATIONS: set[str] = {"..", "^"}
+    _RIGHT_ASSOC_OPERATIONS: frozenset[str] = frozenset(("..", "^"))
+
+    # number of operands, lets expression parsing tell operations apart
+    # without isinstance
+    arity: int = 0
 
-    __slots__ = ("opcode",)
+    __slots__ = "opcode", "precedence", "right_associativity"
 
     def __init__(self, opcode: str) -> None:
         self.opcode = opcode
+        # resolved once here since expression parsing reads them repeatedly
+        self.precedence: int = self._OPERATION_PRECEDENCE[opcode]
+        self.right_associativity: bool = opcode in self._RIGHT_ASSOC_OPERATIONS
 
     @classmethod
     def parsable_from_parser(cls, parser):
         return cls(opcode=next(parser.token_stream).content)
 
     def __repr__(self):
-        return super().__repr__() + f" opcode: {self.opcode}"
-
-    @property
-    def precedence(self) -> int:
-        """get precedence of the operation"""
-        return self._OPERATION_PRECEDENCE[self.opcode]
-
-    @property
-    def right_associativity(self) -> bool:
-        """check whether the operation is right associative"""
-        return self.opcode in self._RIGHT_ASSOC_OPERATIONS
+        return f"{self.__class__.__name__} opcode: {self.opcode}"
@@ -1,6 +1,6 @@
 from __future__ import annotations
+from sys import intern
 from typing import Self
-from itertools import chain
 
 from lua.lua_ast.lexer import BufferedTokenStream
 from lua.lua_ast.exceptions import WrongTokenError
@@ -23,15 +23,16 @@ class NameNode(DataNode, ParsableSkipable):
     __slots__ = ("name",)
 
     def __init__(self, name: str) -> None:
-        self.name = name
+        # names are used as keys during the analysis so keep one copy of each
+        self.name = intern(name)
 
     def parse_tree_descendants(self):
-        return iter((self.name,))
+        return (self.name,)
 
     def __repr__(self):
-        return super().__repr__() + f" name: {self.name}"
+        return f"{self.__class__.__name__} name: {self.name}"
 
-    PARSABLE_FIRST_TOKEN_NAMES = {"id"}
+    PARSABLE_FIRST_TOKEN_NAMES = frozenset({"id"})
     PARSABLE_ERROR_NAME = "variable name"
 
     @classmethod
@@ -53,32 +54,28 @@ class VarargNode(DataNode, Parsable):
     __slots__ = ()
 
     def parse_tree_descendants(self):
-        return iter(("...",))
+        return ("...",)
 
-    @property
-    def data_type(self):
-        return DataNode.DataTypes.VARARG
+    data_type = DataNode.DataTypes.VARARG
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"..."}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"..."})
     PARSABLE_ERROR_NAME = "vararg expression"
 
 
 class ConstNode(DataNode, Parsable):
-    __slots__ = "value", "__d_type"
+    __slots__ = "value", "data_type", "__parse_tree"
 
     def __init__(self, value: str, data_type: DataNode.DataTypes) -> None:
         self.value = value
-        self.__d_type = data_type
+        self.data_type = data_type
+        # constants are never changed after parsing
+        self.__parse_tree = (value,)
 
     def parse_tree_descendants(self):
-        return iter((self.value,))
+        return self.__parse_tree
 
     def __repr__(self):
-        return repr(super()) + f" value: {self.value}"
-
-    @property
-    def data_type(self):
-        return self.__d_type
+        return f"{self.__class__.__name__} value: {self.value}"
 
     _D_T_TYPES = TokenDispatchTable(
         {
@@ -88,46 +85,47 @@ class ConstNode(DataNode, Parsable):
         },
         {
             "string": DataNode.DataTypes.STRING,
-            "numeral": DataNode.DataTypes.NUMBER_INT,
+            "numeral_int": DataNode.DataTypes.NUMBER_INT,
+            "numeral_float": DataNode.DataTypes.NUMBER_FLOAT,
         },
     )
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = _D_T_TYPES.contents.keys()
-    PARSABLE_FIRST_TOKEN_NAMES = _D_T_TYPES.names.keys()
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset(_D_T_TYPES.contents)
+    PARSABLE_FIRST_TOKEN_NAMES = frozenset(_D_T_TYPES.names)
     PARSABLE_ERROR_NAME = "consant variable"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
         t = next(parser.token_stream)
-        d_type: DataNode.DataTypes = cls._D_T_TYPES[t]  # type: ignore
+        return cls(t.content, cls._D_T_TYPES[t])
 
-        # float check
-        if d_type == DataNode.DataTypes.NUMBER_INT:
-            for lit in t.content:
-                if lit in {".", "p", "P", "e", "E"}:
-                    d_type = DataNode.DataTypes.NUMBER_FLOAT
-                    break
 
-        return cls(t.content, d_type)
+_FIELD_SEPARATORS = frozenset((",", ";"))
 
 
 class TableConstrNode(DataNode, ParsableSkipable):
-    __slots__ = ("field_node_list",)
+    __slots__ = "field_node_list", "__parse_tree"
 
     def __init__(self, field_node_list: list[FieldNode]) -> None:
         self.field_node_list = field_node_list
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
         return reversed(self.field_node_list)
 
     def parse_tree_descendants(self):
-        return chain(("}",), iter_sep(reversed(self.field_node_list)), ("{",))
+        if self.__parse_tree is None:
+            self.__parse_tree = (
+                "}",
+                *iter_sep(reversed(self.field_node_list)),
+                "{",
+            )
+
+        return self.__parse_tree
 
-    @property
-    def data_type(self):
-        return DataNode.DataTypes.TABLE
+    data_type = DataNode.DataTypes.TABLE
 
-    PARSABLE_FIRST_TOKEN_CONTENTS: set = {"{"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"{"})
     PARSABLE_ERROR_NAME = "table constructor"
 
     @classmethod
@@ -137,15 +135,28 @@ class TableConstrNode(DataNode, ParsableSkipable):
         # skip {
         err_name = next(stream).content
 
-        # fill fieldlist if it exist
+        # fill fieldlist if it exist, trailing separator is allowed
         if FieldNode.parsable_presented_in_stream(stream):
-            field_separators = {",", ";"}
-            field_node_list.extend(parser.parse_list(FieldNode, field_separators))
-            err_name = field_node_list[-1].PARSABLE_ERROR_NAME
-
-            if stream.peek().content in field_separators:
+            # fields are appended straight into the node list, table
+            # constructors may hold thousands of them
+            add_field = field_node_list.append
+            parse_parsable = parser.parse_parsable
+            field_presented = FieldNode.parsable_presented_in_stream
+            peek = stream.peek
+            field_err_name = FieldNode.PARSABLE_ERROR_NAME
+
+            add_field(parse_parsable(FieldNode))
+            err_name = field_err_name
+
+            while peek().content in _FIELD_SEPARATORS:
                 err_name = next(stream).content
 
+                if not field_presented(stream):
+                    break
+
+                add_field(parse_parsable(FieldNode))
+                err_name = field_err_name
+
         parser.parse_terminal("}", err_name)
         return cls(field_node_list)
 
@@ -161,22 +172,34 @@ import lua.lua_ast.ast_nodes.nodes.extractor_nodes as extractor_nodes
 
 @parsable_starts_with(NameNode)
 class PrefExpNode(DataNode, ParsableSkipable):
-    __slots__ = "var_node", "extractor_node_list"
+    __slots__ = "var_node", "extractor_node_list", "__parse_tree"
 
     def __init__(
         self, var_node: NameNode | ExpNode, extractor_node_list: list[AstNode]
     ) -> None:
         self.var_node = var_node
         self.extractor_node_list = extractor_node_list
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(reversed(self.extractor_node_list), (self.var_node,))
+        return (*reversed(self.extractor_node_list), self.var_node)
 
     def parse_tree_descendants(self):
-        if isinstance(self.var_node, ExpNode):
-            return chain(reversed(self.extractor_node_list), (")", self.var_node, "("))
+        if self.__parse_tree is None:
+            if isinstance(self.var_node, ExpNode):
+                self.__parse_tree = (
+                    *reversed(self.extractor_node_list),
+                    ")",
+                    self.var_node,
+                    "(",
+                )
+            else:
+                self.__parse_tree = (
+                    *reversed(self.extractor_node_list),
+                    self.var_node,
+                )
 
-        return chain(reversed(self.extractor_node_list), (self.var_node,))
+        return self.__parse_tree
 
     _D_T_EXTRACTORS = TokenDispatchTable.dispatch_types(
         extractor_nodes.TableGetterNode,
@@ -184,7 +207,7 @@ class PrefExpNode(DataNode, ParsableSkipable):
         extractor_nodes.MethodGetterNode,
     )
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"("}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"("})
     PARSABLE_ERROR_NAME = "prefix expression"
 
     @classmethod
@@ -193,57 +216,94 @@ class PrefExpNode(DataNode, ParsableSkipable):
         if NameNode.parsable_presented_in_stream(stream):
             var = parser.parse_parsable(NameNode)
         else:
-            (var,) = parser.parse_simple_rule((ExpNode, ")"), next(stream).content)
+            var = parser.parse_closed(ExpNode, ")", next(stream).content)
 
         extractor_node_list = []
+        add_extractor = extractor_node_list.append
+        parse_parsable = parser.parse_parsable
+        peek = stream.peek
+        ext_by_key = _PREFEXP_EXTRACTORS.flat.get
         # now parse all extractor_nodes
-        while (ext_type := cls._D_T_EXTRACTORS[stream.peek()]) is not None:
-            extractor_node_list.append(parser.parse_parsable(ext_type))
+        while (ext_type := ext_by_key(peek().dispatch_key)) is not None:
+            add_extractor(parse_parsable(ext_type))
 
         return cls(var, extractor_node_list)
 
     @classmethod
-    def skip_to_last_ext(cls, stream: BufferedTokenStream, index: int = 0) -> int:
-        """return index of first token of last extractor
-        if no extractors will return index of first token
-        before Name | ( exp ) rule
+    def skip_extractors(
+        cls, stream: BufferedTokenStream, index: int = 0
+    ) -> tuple[int, int, type[ParsableSkipable] | None]:
+        """return index of first token of last extractor, index of first token
+        after prefexp and type of last extractor
+        if no extractors first two indexes point to token after Name | ( exp ) rule
+        if there is no prefexp in stream they are both equal to index
         """
 
-        new_index = NameNode.parsable_skip_in_stream(stream, index)
+        peek = stream.peek
+        peek_matching = stream.peek_matching_parenthesis
+        # name skipping is inlined as well, it is just one token
+        name_names = NameNode.PARSABLE_FIRST_TOKEN_NAMES
 
-        if new_index == index:
-            new_index = stream.peek_matching_parenthesis("(", ")", index)
+        if peek(index).name in name_names:
+            new_index = index + 1
+        else:
+            new_index = peek_matching("(", ")", index)
 
         # if we havent moved -> there is no prefexp in stream
         if new_index == index:
-            return index
+            return index, index, None
 
-        # now get position of the last extractor
-        if (last_extractor := cls._D_T_EXTRACTORS[stream.peek(new_index)]) is not None:
-            while True:
-                index = last_extractor.parsable_skip_in_stream(stream, new_index)
-                if (next_extractor := cls._D_T_EXTRACTORS[stream.peek(index)]) is None:
-                    break
+        table_getter = extractor_nodes.TableGetterNode
+        func_getter = extractor_nodes.FuncGetterNode
+        end_index = new_index
+        last_extractor: type[ParsableSkipable] | None = None
 
-                new_index = index
-                last_extractor = next_extractor
+        # now get position of the last extractor
+        # extractors skipping is inlined since it runs on every prefexp lookahead
+        while True:
+            t = peek(end_index)
+            sym = t.content
+
+            if sym == ".":
+                next_extractor = table_getter
+                next_index = end_index + 1
+                if peek(next_index).name in name_names:
+                    next_index += 1
+            elif sym == "(":
+                next_extractor = func_getter
+                next_index = peek_matching("(", ")", end_index)
+            elif sym == "[":
+                next_extractor = table_getter
+                next_index = peek_matching("[", "]", end_index)
+            elif sym == ":":
+                next_extractor = extractor_nodes.MethodGetterNode
+                next_index = end_index + 1
+                if peek(next_index).name in name_names:
+                    next_index += 1
+                next_index = func_getter.parsable_skip_in_stream(stream, next_index)
+            elif sym == "{":
+                next_extractor = func_getter
+                next_index = peek_matching("{", "}", end_index)
+            elif t.name == "string":
+                next_extractor = func_getter
+                next_index = end_index + 1
+            else:
+                return new_index, end_index, last_extractor
 
-        return new_index
+            new_index = end_index
+            end_index = next_index
+            last_extractor = next_extractor
 
     @classmethod
     def parsable_skip_in_stream(
         cls, stream: BufferedTokenStream, index: int = 0
     ) -> int:
-        new_index = cls.skip_to_last_ext(stream, index)
-
-        # have we moved?
-        if new_index == index:
-            return index
+        return cls.skip_extractors(stream, index)[1]
 
-        if (last_extractor := cls._D_T_EXTRACTORS[stream.peek(new_index)]) is not None:
-            new_index = last_extractor.parsable_skip_in_stream(stream, new_index)
 
-        return new_index
+# hot parsing loops read dispatch tables through module globals
+# instead of class attribute lookups
+_PREFEXP_EXTRACTORS = PrefExpNode._D_T_EXTRACTORS
 
 
 # var node is just PrefExpNode which ends with table extractor or
@@ -258,10 +318,12 @@ class VarNode(PrefExpNode, Parsable):
         # VarNode is PrefExpNode with var = name and extractors = []
         # or just PrefExpNode with extractors[-1] = TableGetterNode
 
-        last_ext_offset = cls.skip_to_last_ext(stream, index)
+        table_getter = extractor_nodes.TableGetterNode
+        last_ext_offset, _, last_ext = cls.skip_extractors(stream, index)
 
-        if extractor_nodes.TableGetterNode.parsable_presented_in_stream(
-            stream, last_ext_offset
+        if last_ext is table_getter or (
+            last_ext is None
+            and table_getter.parsable_presented_in_stream(stream, last_ext_offset)
         ):
             return True
 
@@ -272,30 +334,24 @@ import lua.lua_ast.ast_nodes.nodes.function_nodes as function_nodes
 
 
 class FuncDefNode(DataNode, Parsable):
-    __slots__ = ("funcbody_node",)
+    __slots__ = "funcbody_node", "__parse_tree"
 
     def __init__(
         self,
         funcbody_node: function_nodes.FuncBodyNode,
     ) -> None:
         self.funcbody_node = funcbody_node
+        self.__parse_tree = (funcbody_node, "function")
 
     def descendants(self):
-        return iter((self.funcbody_node,))
+        return (self.funcbody_node,)
 
     def parse_tree_descendants(self):
-        return iter(
-            (
-                self.funcbody_node,
-                "function",
-            )
-        )
+        return self.__parse_tree
 
-    @property
-    def data_type(self):
-        return DataNode.DataTypes.FUNCTION
+    data_type = DataNode.DataTypes.FUNCTION
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"function"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"function"})
     PARSABLE_ERROR_NAME = "function definition"
 
     @classmethod
@@ -314,20 +370,24 @@ def _stack_form_binops(
     top_precedence: int,
     exp_stack: list,
 ):
-    while len(exp_stack) > 1 and (
-        exp_stack[-2].precedence > top_precedence
-        or exp_stack[-2].precedence == top_precedence
-        and exp_stack[-2].right_associativity
-    ):
-        d_2 = exp_stack.pop()
-        op = exp_stack.pop()
+    while len(exp_stack) > 1:
+        op = exp_stack[-2]
+        precedence = op.precedence
 
-        op.right_operand_node = d_2
+        if precedence < top_precedence or (
+            precedence == top_precedence and not op.right_associativity
+        ):
+            break
 
-        if isinstance(op, operation_nodes.BinOpNode):
-            op.left_operand_node = exp_stack.pop()
+        op.right_operand_node = exp_stack[-1]
 
-        exp_stack.append(op)
+        # operation replaces its operands on the stack in place
+        if op.arity == 2:
+            op.left_operand_node = exp_stack[-3]
+            exp_stack[-3] = op
+            del exp_stack[-2:]
+        else:
+            del exp_stack[-1]
 
 
 @parsable_starts_with(
@@ -345,13 +405,21 @@ class ExpNode(DataNode, Parsable):
         self.data_node = data_node
 
     def descendants(self):
-        return iter((self.data_node,))
+        return (self.data_node,)
 
+    # expression adds no terminals of its own, so traversal goes
+    # straight to the wrapped node instead of stacking it first
     def parse_tree_descendants(self):
-        return iter((self.data_node,))
+        return self.data_node.parse_tree_descendants()
 
+    # unary operations stand in operand position so they share one table
     _D_T_OPERAND = TokenDispatchTable.dispatch_types(
-        ConstNode, PrefExpNode, TableConstrNode, FuncDefNode, VarargNode
+        ConstNode,
+        PrefExpNode,
+        TableConstrNode,
+        FuncDefNode,
+        VarargNode,
+        operation_nodes.UnOpNode,
     )
 
     PARSABLE_ERROR_NAME = "expression"
@@ -359,58 +427,83 @@ class ExpNode(DataNode, Parsable):
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
         stream = parser.token_stream
+        peek = stream.peek
+        parse_parsable = parser.parse_parsable
+        form_binops = _stack_form_binops
         exp_stack: list[DataNode | OperationNode] = []
+        push = exp_stack.append
+        operand_by_key = _EXP_OPERANDS.flat.get
+        unop_type = operation_nodes.UnOpNode
+        binop_type = operation_nodes.BinOpNode
+        # binary operations can be recognized only by token contents
+        binop_contents = binop_type.PARSABLE_FIRST_TOKEN_CONTENTS
 
         while True:
-            while operation_nodes.UnOpNode.parsable_presented_in_stream(stream):
-                exp_stack.append(parser.parse_parsable(operation_nodes.UnOpNode))
+            t = peek()
 
-            if (operand_type := cls._D_T_OPERAND[stream.peek()]) is None:
+            if (operand_type := operand_by_key(t.dispatch_key)) is None:
                 t = next(stream)
                 raise WrongTokenError(t.content, t.pos, "operand")
 
-            exp_stack.append(parser.parse_parsable(operand_type))
+            push(parse_parsable(operand_type))
 
-            if operation_nodes.BinOpNode.parsable_presented_in_stream(stream):
-                next_op = parser.parse_parsable(operation_nodes.BinOpNode)
-                _stack_form_binops(next_op.precedence, exp_stack)
-                exp_stack.append(next_op)
+            # unary operation is followed by its operand
+            if operand_type is unop_type:
+                continue
+
+            if peek().content in binop_contents:
+                next_op = parse_parsable(binop_type)
+                form_binops(next_op.precedence, exp_stack)
+                push(next_op)
 
             else:
-                _stack_form_binops(-1, exp_stack)
+                form_binops(-1, exp_stack)
                 break
 
         return cls(exp_stack.pop())
 
 
+_EXP_OPERANDS = ExpNode._D_T_OPERAND
+
+
 @parsable_starts_with(ExpNode, NameNode)
 class FieldNode(DataNode, Parsable):
-    __slots__ = "index_node", "exp_node"
+    __slots__ = "index_node", "exp_node", "__parse_tree"
 
     def __init__(
         self, index_node: ExpNode | NameNode | None, exp_node: ExpNode
     ) -> None:
         self.index_node = index_node
         self.exp_node = exp_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
         if self.index_node is not None:
-            return iter((self.exp_node, self.index_node))
+            return (self.exp_node, self.index_node)
 
-        return iter((self.exp_node,))
+        return (self.exp_node,)
 
     def parse_tree_descendants(self):
-        match self.index_node:
-            case ExpNode():
-                return iter((self.exp_node, "=", "]", self.index_node, "["))
-
-            case NameNode():
-                return iter((self.exp_node, "=", self.index_node))
-
-            case None:
-                return iter((self.exp_node,))
-
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"["}
+        if self.__parse_tree is None:
+            match self.index_node:
+                case ExpNode():
+                    self.__parse_tree = (
+                        self.exp_node,
+                        "=",
+                        "]",
+                        self.index_node,
+                        "[",
+                    )
+
+                case NameNode():
+                    self.__parse_tree = (self.exp_node, "=", self.index_node)
+
+                case None:
+                    self.__parse_tree = (self.exp_node,)
+
+        return self.__parse_tree
+
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"["})
     PARSABLE_ERROR_NAME = "table constructor field"
 
     @classmethod
@@ -419,9 +512,8 @@ class FieldNode(DataNode, Parsable):
         index_node = None
 
         if stream.peek().content == "[":
-            (index_node,) = parser.parse_simple_rule(
-                (ExpNode, "]", "="), next(stream).content
-            )
+            index_node = parser.parse_closed(ExpNode, "]", next(stream).content)
+            parser.parse_terminal("=", "]")
 
         elif stream.peek(1).content == "=":
             index_node = parser.parse_parsable(NameNode)
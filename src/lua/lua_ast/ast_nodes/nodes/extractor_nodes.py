@@ -1,6 +1,5 @@
 from __future__ import annotations
 from typing import Self
-from itertools import chain
 
 from lua.lua_ast.lexer import BufferedTokenStream
 from lua.lua_ast.parsing import (
@@ -16,21 +15,24 @@ import lua.lua_ast.ast_nodes.nodes.data_nodes as data_nodes
 
 
 class TableGetterNode(AstNode, ParsableSkipable):
-    __slots__ = ("field_node",)
+    __slots__ = "field_node", "__parse_tree"
 
     def __init__(self, field_node: data_nodes.NameNode | data_nodes.ExpNode) -> None:
         self.field_node = field_node
+        # field kind is fixed after parsing, so the check is done once here
+        self.__parse_tree = (
+            ("]", field_node, "[")
+            if isinstance(field_node, data_nodes.ExpNode)
+            else (field_node, ".")
+        )
 
     def descendants(self):
-        return iter((self.field_node,))
+        return (self.field_node,)
 
     def parse_tree_descendants(self):
-        if isinstance(self.field_node, data_nodes.ExpNode):
-            return iter(("]", self.field_node, "["))
-
-        return iter((self.field_node, "."))
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"[", "."}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"[", "."})
     PARSABLE_ERROR_NAME = "table field"
 
     @classmethod
@@ -39,7 +41,7 @@ class TableGetterNode(AstNode, ParsableSkipable):
         field: data_nodes.NameNode | data_nodes.ExpNode
 
         if t.content == "[":
-            (field,) = parser.parse_simple_rule((data_nodes.ExpNode, "]"), t.content)
+            field = parser.parse_closed(data_nodes.ExpNode, "]", t.content)
 
         else:
             field = parser.parse_parsable(data_nodes.NameNode, t.content, True)
@@ -51,27 +53,34 @@ class TableGetterNode(AstNode, ParsableSkipable):
         cls, stream: BufferedTokenStream, index: int = 0
     ) -> int:
         if stream.peek(index).content == ".":
-            return data_nodes.NameNode.parsable_skip_in_stream(stream, index + 1)
+            index += 1
+            # name is a single token, skip it without a call
+            name_names = data_nodes.NameNode.PARSABLE_FIRST_TOKEN_NAMES
+            if stream.peek(index).name in name_names:
+                index += 1
+
+            return index
 
         return stream.peek_matching_parenthesis("[", "]", index)
 
 
 class MethodGetterNode(AstNode, ParsableSkipable):
-    __slots__ = "name_node", "funcgetter_node"
+    __slots__ = "name_node", "funcgetter_node", "__parse_tree"
 
     def __init__(
         self, name_node: data_nodes.NameNode, funcgetter_node: FuncGetterNode
     ) -> None:
         self.name_node = name_node
         self.funcgetter_node = funcgetter_node
+        self.__parse_tree = (funcgetter_node, name_node, ":")
 
     def descendants(self):
-        return iter((self.funcgetter_node, self.name_node))
+        return (self.funcgetter_node, self.name_node)
 
     def parse_tree_descendants(self):
-        return iter((self.funcgetter_node, self.name_node, ":"))
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {":"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({":"})
     PARSABLE_ERROR_NAME = "method call"
 
     @classmethod
@@ -90,16 +99,19 @@ class MethodGetterNode(AstNode, ParsableSkipable):
         cls, stream: BufferedTokenStream, index: int = 0
     ) -> int:
         if stream.peek(index).content in cls.PARSABLE_FIRST_TOKEN_CONTENTS:
-            return FuncGetterNode.parsable_skip_in_stream(
-                stream, data_nodes.NameNode.parsable_skip_in_stream(stream, index + 1)
-            )
+            index += 1
+            name_names = data_nodes.NameNode.PARSABLE_FIRST_TOKEN_NAMES
+            if stream.peek(index).name in name_names:
+                index += 1
+
+            return FuncGetterNode.parsable_skip_in_stream(stream, index)
 
         return index
 
 
 @parsable_starts_with(data_nodes.TableConstrNode)
 class FuncGetterNode(AstNode, ParsableSkipable):
-    __slots__ = ("arg",)
+    __slots__ = "arg", "__parse_tree"
 
     def __init__(
         self,
@@ -108,18 +120,22 @@ class FuncGetterNode(AstNode, ParsableSkipable):
         | data_nodes.ConstNode,
     ) -> None:
         self.arg = arg
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
         if isinstance(self.arg, list):
             return reversed(self.arg)
 
-        return iter((self.arg,))
+        return (self.arg,)
 
     def parse_tree_descendants(self):
-        if isinstance(self.arg, list):
-            return chain((")",), iter_sep(reversed(self.arg)), ("(",))
+        if self.__parse_tree is None:
+            if isinstance(self.arg, list):
+                self.__parse_tree = (")", *iter_sep(reversed(self.arg)), "(")
+            else:
+                self.__parse_tree = (self.arg,)
 
-        return iter((self.arg,))
+        return self.__parse_tree
 
     _D_T_ARGS = TokenDispatchTable(
         dict.fromkeys(
@@ -129,8 +145,8 @@ class FuncGetterNode(AstNode, ParsableSkipable):
         {"string": data_nodes.ConstNode},
     )
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"("}
-    PARSABLE_FIRST_TOKEN_NAMES = {"string"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"("})
+    PARSABLE_FIRST_TOKEN_NAMES = frozenset({"string"})
     PARSABLE_ERROR_NAME = "function call"
 
     @classmethod
@@ -140,14 +156,28 @@ class FuncGetterNode(AstNode, ParsableSkipable):
             data_nodes.ExpNode
         ] | data_nodes.TableConstrNode | data_nodes.ConstNode
 
-        if (node_type := cls._D_T_ARGS[stream.peek()]) is not None:
+        # flat table is read directly, __getitem__ would add a python call
+        node_type = _FUNCGETTER_ARGS.flat.get(stream.peek().dispatch_key)
+
+        if node_type is not None:
             arg = parser.parse_parsable(node_type)
         else:
             err_name = next(stream).content
 
-            arg = list(parser.parse_list(data_nodes.ExpNode))
-            if arg:
-                err_name = arg[-1].PARSABLE_ERROR_NAME
+            arg = []
+            exp_type = data_nodes.ExpNode
+
+            # same as parse_list but without generator for frequent calls
+            if exp_type.parsable_presented_in_stream(stream):
+                arg.append(parser.parse_parsable(exp_type))
+
+                while stream.peek().content == "," and (
+                    exp_type.parsable_presented_in_stream(stream, 1)
+                ):
+                    next(stream)
+                    arg.append(parser.parse_parsable(exp_type))
+
+                err_name = exp_type.PARSABLE_ERROR_NAME
 
             parser.parse_terminal(")", err_name)
 
@@ -166,3 +196,7 @@ class FuncGetterNode(AstNode, ParsableSkipable):
             return stream.peek_matching_parenthesis("(", ")", index)
 
         return data_nodes.TableConstrNode.parsable_skip_in_stream(stream, index)
+
+
+# hot parsing code reads dispatch table through module global
+_FUNCGETTER_ARGS = FuncGetterNode._D_T_ARGS
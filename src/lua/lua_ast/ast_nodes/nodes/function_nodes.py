@@ -15,7 +15,7 @@ import lua.lua_ast.ast_nodes.nodes.statement_nodes as statement_nodes
 
 
 class FuncBodyNode(AstNode, Parsable):
-    __slots__ = "name_node_list", "vararg_node", "block_node"
+    __slots__ = "name_node_list", "vararg_node", "block_node", "__parse_tree"
 
     def __init__(
         self,
@@ -26,27 +26,33 @@ class FuncBodyNode(AstNode, Parsable):
         self.name_node_list = name_node_list
         self.vararg_node = vararg_node
         self.block_node = block_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(
-            (self.vararg_node,) if self.vararg_node is not None else (),
-            reversed(self.name_node_list),
-            (self.block_node,),
+        return (
+            *((self.vararg_node,) if self.vararg_node is not None else ()),
+            *reversed(self.name_node_list),
+            self.block_node,
         )
 
     def parse_tree_descendants(self):
-        return chain(
-            ("end", self.block_node, ")"),
-            iter_sep(
-                chain(
-                    (self.vararg_node,) if self.vararg_node is not None else (),
-                    reversed(self.name_node_list),
-                )
-            ),
-            ("(",),
-        )
+        if self.__parse_tree is None:
+            self.__parse_tree = (
+                "end",
+                self.block_node,
+                ")",
+                *iter_sep(
+                    chain(
+                        (self.vararg_node,) if self.vararg_node is not None else (),
+                        reversed(self.name_node_list),
+                    )
+                ),
+                "(",
+            )
+
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"("}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"("})
     PARSABLE_ERROR_NAME = "function body"
 
     @classmethod
@@ -58,16 +64,23 @@ class FuncBodyNode(AstNode, Parsable):
         vararg_node: data_nodes.VarargNode | None = None
 
         if data_nodes.NameNode.parsable_presented_in_stream(stream):
-            name_node_list.extend(parser.parse_list(data_nodes.NameNode))
+            name_node_list.append(parser.parse_parsable(data_nodes.NameNode))
 
-            if stream.peek().content == ",":
-                vararg_node = parser.parse_parsable(
-                    data_nodes.VarargNode,
-                    next(stream).content,
-                    True,
-                    f"{data_nodes.NameNode.PARSABLE_ERROR_NAME} or {data_nodes.VarargNode.PARSABLE_ERROR_NAME}",
-                )
-                err_name = data_nodes.VarargNode.PARSABLE_ERROR_NAME
+            # every ',' is followed either by next name or by closing vararg
+            while stream.peek().content == ",":
+                next(stream)
+
+                if not data_nodes.NameNode.parsable_presented_in_stream(stream):
+                    vararg_node = parser.parse_parsable(
+                        data_nodes.VarargNode,
+                        ",",
+                        True,
+                        f"{data_nodes.NameNode.PARSABLE_ERROR_NAME} or {data_nodes.VarargNode.PARSABLE_ERROR_NAME}",
+                    )
+                    err_name = data_nodes.VarargNode.PARSABLE_ERROR_NAME
+                    break
+
+                name_node_list.append(parser.parse_parsable(data_nodes.NameNode))
 
             else:
                 err_name = data_nodes.NameNode.PARSABLE_ERROR_NAME
@@ -76,16 +89,20 @@ class FuncBodyNode(AstNode, Parsable):
             vararg_node = parser.parse_parsable(data_nodes.VarargNode)
             err_name = data_nodes.VarargNode.PARSABLE_ERROR_NAME
 
-        (block_node,) = parser.parse_simple_rule(
-            (")", statement_nodes.BlockNode, "end"), err_name
+        block_node = parser.parse_enclosed(
+            ")", statement_nodes.BlockNode, "end", err_name
         )
 
         return cls(name_node_list, vararg_node, block_node)
 
 
+# separator of names in function name
+_FUNCNAME_SEPARATORS = frozenset((".",))
+
+
 @parsable_starts_with(data_nodes.NameNode)
 class FuncNameNode(AstNode, Parsable):
-    __slots__ = "name_node_list", "method_name_node"
+    __slots__ = "name_node_list", "method_name_node", "__parse_tree"
 
     # name_node_list always has at least one name
     def __init__(
@@ -95,26 +112,32 @@ class FuncNameNode(AstNode, Parsable):
     ) -> None:
         self.name_node_list = name_node_list
         self.method_name_node = method_name_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        g = reversed(self.name_node_list)
-        return (
-            g if self.method_name_node is None else chain((self.method_name_node,), g)
-        )
+        if self.method_name_node is None:
+            return reversed(self.name_node_list)
+
+        return (self.method_name_node, *reversed(self.name_node_list))
 
     def parse_tree_descendants(self):
-        g = iter_sep(reversed(self.name_node_list), ".")
-        return (
-            g
-            if self.method_name_node is None
-            else chain((self.method_name_node, ":"), g)
-        )
+        if self.__parse_tree is None:
+            g = iter_sep(reversed(self.name_node_list), ".")
+            self.__parse_tree = (
+                tuple(g)
+                if self.method_name_node is None
+                else (self.method_name_node, ":", *g)
+            )
+
+        return self.__parse_tree
 
     PARSABLE_ERROR_NAME = "function name"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        name_node_list = list(parser.parse_list(data_nodes.NameNode, {"."}))
+        name_node_list = list(
+            parser.parse_list(data_nodes.NameNode, _FUNCNAME_SEPARATORS)
+        )
 
         # parse [':' Name]
         stream = parser.token_stream
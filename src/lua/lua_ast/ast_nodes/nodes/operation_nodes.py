@@ -31,9 +31,11 @@ class BinOpNode(OperationNode):
         "^": 11,
     }
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = _OPERATION_PRECEDENCE.keys()
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset(_OPERATION_PRECEDENCE)
     PARSABLE_ERROR_NAME = "binary operation"
 
+    arity = 2
+
     __slots__ = "left_operand_node", "right_operand_node"
 
     def __init__(
@@ -47,19 +49,21 @@ class BinOpNode(OperationNode):
         self.right_operand_node = right_operand_node
 
     def descendants(self):
-        return iter((self.right_operand_node, self.left_operand_node))  # type: ignore
+        return (self.right_operand_node, self.left_operand_node)  # type: ignore
 
     # ExpNode parsing algorithm will always fill left, right operands so we dont listen mypy here
     def parse_tree_descendants(self):
-        return iter((self.right_operand_node, self.opcode, self.left_operand_node))  # type: ignore
+        return (self.right_operand_node, self.opcode, self.left_operand_node)  # type: ignore
 
 
 class UnOpNode(OperationNode):
     _OPERATION_PRECEDENCE = {"-": 10, "not": 10, "#": 10, "~": 10}
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = _OPERATION_PRECEDENCE.keys()
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset(_OPERATION_PRECEDENCE)
     PARSABLE_ERROR_NAME = "unary operation"
 
+    arity = 1
+
     __slots__ = ("right_operand_node",)
 
     def __init__(self, right_operand_node: DataNode | None = None, **kwargs) -> None:
@@ -67,7 +71,7 @@ class UnOpNode(OperationNode):
         self.right_operand_node = right_operand_node
 
     def descendants(self):
-        return iter((self.right_operand_node,))  # type: ignore
+        return (self.right_operand_node,)  # type: ignore
 
     def parse_tree_descendants(self):
-        return iter((self.right_operand_node, self.opcode))  # type: ignore
+        return (self.right_operand_node, self.opcode)  # type: ignore
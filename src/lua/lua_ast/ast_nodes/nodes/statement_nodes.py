@@ -1,6 +1,6 @@
 from __future__ import annotations
 from typing import Self
-from itertools import chain, cycle
+from itertools import chain
 
 from lua.lua_ast.lexer import BufferedTokenStream
 from lua.lua_ast.parsing import (
@@ -15,6 +15,7 @@ from lua.lua_ast.exceptions import WrongTokenError
 
 import lua.lua_ast.ast_nodes.nodes.data_nodes as data_nodes
 import lua.lua_ast.ast_nodes.nodes.extractor_nodes as extractor_nodes
+import lua.lua_ast.ast_nodes.nodes.function_nodes as function_nodes
 
 
 class FuncCallNode(data_nodes.PrefExpNode):
@@ -26,13 +27,8 @@ class FuncCallNode(data_nodes.PrefExpNode):
     def parsable_presented_in_stream(
         cls, stream: BufferedTokenStream, index: int = 0
     ) -> bool:
-        new_index = cls.skip_to_last_ext(stream, index)
-
-        if new_index == index:
-            return False
-
         # now check last extractor
-        last_ext = cls._D_T_EXTRACTORS[stream.peek(new_index)]
+        last_ext = cls.skip_extractors(stream, index)[2]
         return (
             last_ext is extractor_nodes.FuncGetterNode
             or last_ext is extractor_nodes.MethodGetterNode
@@ -46,18 +42,18 @@ class LabelNode(AstNode, Parsable):
         self.name_node = name_node
 
     def descendants(self):
-        return iter((self.name_node,))
+        return (self.name_node,)
 
     def parse_tree_descendants(self):
-        return iter(("::", self.name_node, "::"))
+        return ("::", self.name_node, "::")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"::"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"::"})
     PARSABLE_ERROR_NAME = "label"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        (name_node,) = parser.parse_simple_rule(
-            (data_nodes.NameNode, "::"), next(parser.token_stream).content
+        name_node = parser.parse_closed(
+            data_nodes.NameNode, "::", next(parser.token_stream).content
         )
         return cls(name_node)
 
@@ -66,9 +62,9 @@ class BreakNode(AstNode, Parsable):
     __slots__ = ()
 
     def parse_tree_descendants(self):
-        return iter(("break",))
+        return ("break",)
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"break"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"break"})
     PARSABLE_MARK_POS = True
 
 
@@ -79,12 +75,12 @@ class GotoNode(AstNode, Parsable):
         self.name_node = name_node
 
     def descendants(self):
-        return iter((self.name_node,))
+        return (self.name_node,)
 
     def parse_tree_descendants(self):
-        return iter((self.name_node, "goto"))
+        return (self.name_node, "goto")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"goto"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"goto"})
     PARSABLE_ERROR_NAME = "goto statement"
     PARSABLE_MARK_POS = True
 
@@ -104,18 +100,18 @@ class DoBlockNode(AstNode, Parsable):
         self.block_node = block_node
 
     def descendants(self):
-        return iter((self.block_node,))
+        return (self.block_node,)
 
     def parse_tree_descendants(self):
-        return iter(("end", self.block_node, "do"))
+        return ("end", self.block_node, "do")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"do"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"do"})
     PARSABLE_ERROR_NAME = "do statement"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        (block_node,) = parser.parse_simple_rule(
-            (BlockNode, "end"), next(parser.token_stream).content
+        block_node = parser.parse_closed(
+            BlockNode, "end", next(parser.token_stream).content
         )
         return cls(block_node)
 
@@ -131,20 +127,20 @@ class WhileLoopNode(AstNode, Parsable):
         self.block_node = block_node
 
     def descendants(self):
-        return iter((self.block_node, self.exp_node))
+        return (self.block_node, self.exp_node)
 
     def parse_tree_descendants(self):
-        return iter(("end", self.block_node, "do", self.exp_node, "while"))
+        return ("end", self.block_node, "do", self.exp_node, "while")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"while"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"while"})
     PARSABLE_ERROR_NAME = "while loop"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        exp_node, block_node = parser.parse_simple_rule(
-            (data_nodes.ExpNode, "do", BlockNode, "end"),
-            next(parser.token_stream).content,
+        exp_node = parser.parse_closed(
+            data_nodes.ExpNode, "do", next(parser.token_stream).content
         )
+        block_node = parser.parse_closed(BlockNode, "end", "do")
         return cls(exp_node, block_node)
 
 
@@ -156,20 +152,20 @@ class RepeatLoopNode(AstNode, Parsable):
         self.block_node = block_node
 
     def descendants(self):
-        return iter((self.block_node, self.exp_node))
+        return (self.block_node, self.exp_node)
 
     def parse_tree_descendants(self):
-        return iter((self.block_node, "until", self.exp_node, "repeat"))
+        return (self.block_node, "until", self.exp_node, "repeat")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"repeat"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"repeat"})
     PARSABLE_ERROR_NAME = "repeat loop"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        block_node, exp_node = parser.parse_simple_rule(
-            (BlockNode, "until", data_nodes.ExpNode),
-            next(parser.token_stream).content,
+        block_node = parser.parse_closed(
+            BlockNode, "until", next(parser.token_stream).content
         )
+        exp_node = parser.parse_parsable(data_nodes.ExpNode, "until", True)
         return cls(exp_node, block_node)
 
 
@@ -180,6 +176,7 @@ class ForLoopNode(AstNode, Parsable):
         "cond_exp_node",
         "iter_exp_node",
         "block_node",
+        "__parse_tree",
     )
 
     def __init__(
@@ -195,35 +192,43 @@ class ForLoopNode(AstNode, Parsable):
         self.cond_exp_node = cond_exp_node
         self.iter_exp_node = iter_exp_node
         self.block_node = block_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return iter(
-            (
+        return (
+            self.block_node,
+            *(() if self.iter_exp_node is None else (self.iter_exp_node,)),
+            self.cond_exp_node,
+            self.assign_exp_node,
+            self.name_node,
+        )
+
+    def parse_tree_descendants(self):
+        if self.__parse_tree is None:
+            self.__parse_tree = (
+                "end",
                 self.block_node,
-                *(() if self.iter_exp_node is None else (self.iter_exp_node,)),
+                "do",
+                *(() if self.iter_exp_node is None else (self.iter_exp_node, ",")),
                 self.cond_exp_node,
+                ",",
                 self.assign_exp_node,
+                "=",
                 self.name_node,
+                "for",
             )
-        )
 
-    def parse_tree_descendants(self):
-        return chain(
-            ("end", self.block_node, "do"),
-            () if self.iter_exp_node is None else (self.iter_exp_node, ","),
-            (self.cond_exp_node, ",", self.assign_exp_node, "=", self.name_node, "for"),
-        )
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"for"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"for"})
     PARSABLE_ERROR_NAME = "for loop"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
         stream = parser.token_stream
-        name_node, assign_exp_node, cond_exp_node = parser.parse_simple_rule(
-            (data_nodes.NameNode, "=", data_nodes.ExpNode, ",", data_nodes.ExpNode),
-            next(stream).content,
-        )
+        name_node = parser.parse_closed(data_nodes.NameNode, "=", next(stream).content)
+        assign_exp_node = parser.parse_closed(data_nodes.ExpNode, ",", "=")
+        cond_exp_node = parser.parse_parsable(data_nodes.ExpNode, ",", True)
 
         # get optional iter expression
         last_err_str = cond_exp_node.PARSABLE_ERROR_NAME
@@ -234,7 +239,7 @@ class ForLoopNode(AstNode, Parsable):
             )
             last_err_str = iter_exp_node.PARSABLE_ERROR_NAME
 
-        (block_node,) = parser.parse_simple_rule(("do", BlockNode, "end"), last_err_str)
+        block_node = parser.parse_enclosed("do", BlockNode, "end", last_err_str)
 
         return cls(name_node, assign_exp_node, cond_exp_node, iter_exp_node, block_node)
 
@@ -249,7 +254,7 @@ class ForLoopNode(AstNode, Parsable):
 
 
 class ForIterLoopNode(AstNode, Parsable):
-    __slots__ = "name_node_list", "exp_node_list", "block_node"
+    __slots__ = "name_node_list", "exp_node_list", "block_node", "__parse_tree"
 
     def __init__(
         self,
@@ -260,24 +265,30 @@ class ForIterLoopNode(AstNode, Parsable):
         self.name_node_list = name_node_list
         self.exp_node_list = exp_node_list
         self.block_node = block_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(
-            (self.block_node,),
-            reversed(self.exp_node_list),
-            reversed(self.name_node_list),
+        return (
+            self.block_node,
+            *reversed(self.exp_node_list),
+            *reversed(self.name_node_list),
         )
 
     def parse_tree_descendants(self):
-        return chain(
-            ("end", self.block_node, "do"),
-            iter_sep(reversed(self.exp_node_list)),
-            ("in",),
-            iter_sep(reversed(self.name_node_list)),
-            ("for",),
-        )
+        if self.__parse_tree is None:
+            self.__parse_tree = (
+                "end",
+                self.block_node,
+                "do",
+                *iter_sep(reversed(self.exp_node_list)),
+                "in",
+                *iter_sep(reversed(self.name_node_list)),
+                "for",
+            )
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"for"}
+        return self.__parse_tree
+
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"for"})
     PARSABLE_ERROR_NAME = "iterator loop"
 
     @classmethod
@@ -297,8 +308,8 @@ class ForIterLoopNode(AstNode, Parsable):
             parser.parse_list(data_nodes.ExpNode, non_empty=True, error_name="'in'")
         )
 
-        (block_node,) = parser.parse_simple_rule(
-            ("do", BlockNode, "end"), exp_node_list[-1].PARSABLE_ERROR_NAME
+        block_node = parser.parse_enclosed(
+            "do", BlockNode, "end", exp_node_list[-1].PARSABLE_ERROR_NAME
         )
 
         return cls(name_node_list, exp_node_list, block_node)
@@ -318,7 +329,7 @@ class ForIterLoopNode(AstNode, Parsable):
 
 @parsable_starts_with(data_nodes.VarNode)
 class VarsAssignNode(AstNode, Parsable):
-    __slots__ = "var_node_list", "exp_node_list"
+    __slots__ = "var_node_list", "exp_node_list", "__parse_tree"
 
     def __init__(
         self,
@@ -327,16 +338,20 @@ class VarsAssignNode(AstNode, Parsable):
     ) -> None:
         self.var_node_list = var_node_list
         self.exp_node_list = exp_node_list
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(reversed(self.exp_node_list), reversed(self.var_node_list))
+        return (*reversed(self.exp_node_list), *reversed(self.var_node_list))
 
     def parse_tree_descendants(self):
-        return chain(
-            iter_sep(reversed(self.exp_node_list)),
-            ("=",),
-            iter_sep(reversed(self.var_node_list)),
-        )
+        if self.__parse_tree is None:
+            self.__parse_tree = (
+                *iter_sep(reversed(self.exp_node_list)),
+                "=",
+                *iter_sep(reversed(self.var_node_list)),
+            )
+
+        return self.__parse_tree
 
     PARSABLE_ERROR_NAME = "variable assigment"
 
@@ -365,7 +380,7 @@ class VarsAssignNode(AstNode, Parsable):
 
 
 class LocalVarsAssignNode(AstNode, Parsable):
-    __slots__ = "name_node_list", "exp_node_list"
+    __slots__ = "name_node_list", "exp_node_list", "__parse_tree"
 
     def __init__(
         self,
@@ -374,22 +389,29 @@ class LocalVarsAssignNode(AstNode, Parsable):
     ) -> None:
         self.name_node_list = name_node_list
         self.exp_node_list = exp_node_list
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(reversed(self.exp_node_list), reversed(self.name_node_list))
+        return (*reversed(self.exp_node_list), *reversed(self.name_node_list))
 
     def parse_tree_descendants(self):
-        if self.exp_node_list:
-            return chain(
-                iter_sep(reversed(self.exp_node_list)),
-                ("=",),
-                iter_sep(reversed(self.name_node_list)),
-                ("local",),
-            )
+        if self.__parse_tree is None:
+            if self.exp_node_list:
+                self.__parse_tree = (
+                    *iter_sep(reversed(self.exp_node_list)),
+                    "=",
+                    *iter_sep(reversed(self.name_node_list)),
+                    "local",
+                )
+            else:
+                self.__parse_tree = (
+                    *iter_sep(reversed(self.name_node_list)),
+                    "local",
+                )
 
-        return chain(iter_sep(reversed(self.name_node_list)), ("local",))
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"local"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"local"})
     PARSABLE_ERROR_NAME = "local variable assigment"
 
     @classmethod
@@ -428,9 +450,6 @@ class LocalVarsAssignNode(AstNode, Parsable):
         )
 
 
-import lua.lua_ast.ast_nodes.nodes.function_nodes as function_nodes
-
-
 class FuncAssignNode(AstNode, Parsable):
     __slots__ = "funcname_node", "funcbody_node"
 
@@ -443,19 +462,23 @@ class FuncAssignNode(AstNode, Parsable):
         self.funcbody_node = funcbody_node
 
     def descendants(self):
-        return iter((self.funcbody_node, self.funcname_node))
+        return (self.funcbody_node, self.funcname_node)
 
     def parse_tree_descendants(self):
-        return iter((self.funcbody_node, self.funcname_node, "function"))
+        return (self.funcbody_node, self.funcname_node, "function")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"function"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"function"})
     PARSABLE_ERROR_NAME = "function declaration"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        funcname_node, funcbody_node = parser.parse_simple_rule(
-            (function_nodes.FuncNameNode, function_nodes.FuncBodyNode),
-            next(parser.token_stream).content,
+        funcname_node = parser.parse_parsable(
+            function_nodes.FuncNameNode, next(parser.token_stream).content, True
+        )
+        funcbody_node = parser.parse_parsable(
+            function_nodes.FuncBodyNode,
+            function_nodes.FuncNameNode.PARSABLE_ERROR_NAME,
+            True,
         )
         return cls(funcname_node, funcbody_node)
 
@@ -470,19 +493,20 @@ class LocalFuncAssignNode(AstNode, Parsable):
         self.funcbody_node = funcbody_node
 
     def descendants(self):
-        return iter((self.funcbody_node, self.name_node))
+        return (self.funcbody_node, self.name_node)
 
     def parse_tree_descendants(self):
-        return iter((self.funcbody_node, self.name_node, "function", "local"))
+        return (self.funcbody_node, self.name_node, "function", "local")
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"local"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"local"})
     PARSABLE_ERROR_NAME = "local function declaration"
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
-        name_node, funcbody_node = parser.parse_simple_rule(
-            ("function", data_nodes.NameNode, function_nodes.FuncBodyNode),
-            next(parser.token_stream).content,
+        parser.parse_terminal("function", next(parser.token_stream).content)
+        name_node = parser.parse_parsable(data_nodes.NameNode, "function", True)
+        funcbody_node = parser.parse_parsable(
+            function_nodes.FuncBodyNode, data_nodes.NameNode.PARSABLE_ERROR_NAME, True
         )
 
         return cls(name_node, funcbody_node)
@@ -501,7 +525,7 @@ class LocalFuncAssignNode(AstNode, Parsable):
 
 
 class IfNode(AstNode, Parsable):
-    __slots__ = "block_exp", "block_exp_list", "else_block_node"
+    __slots__ = "block_exp", "block_exp_list", "else_block_node", "__parse_tree"
 
     def __init__(
         self,
@@ -512,34 +536,31 @@ class IfNode(AstNode, Parsable):
         self.block_exp = block_exp
         self.block_exp_list = block_exp_list
         self.else_block_node = else_block_node
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
-        return chain(
-            () if self.else_block_node is None else (self.else_block_node,),
-            chain.from_iterable(reversed(self.block_exp_list)),
-            iter(self.block_exp),
+        return (
+            *(() if self.else_block_node is None else (self.else_block_node,)),
+            *chain.from_iterable(reversed(self.block_exp_list)),
+            *self.block_exp,
         )
 
     def parse_tree_descendants(self):
-        return chain(
-            (
-                "end",
-                *(
-                    ()
-                    if self.else_block_node is None
-                    else (self.else_block_node, "else")
-                ),
-            ),
-            chain.from_iterable(
-                zip(
-                    chain.from_iterable(reversed(self.block_exp_list)),
-                    cycle(("then", "elseif")),
-                )
-            ),
-            (self.block_exp[0], "then", self.block_exp[1], "if"),
-        )
+        if self.__parse_tree is None:
+            parse_tree: list[AstNode | str] = ["end"]
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"if"}
+            if self.else_block_node is not None:
+                parse_tree += (self.else_block_node, "else")
+
+            for block_node, exp_node in reversed(self.block_exp_list):
+                parse_tree += (block_node, "then", exp_node, "elseif")
+
+            parse_tree += (self.block_exp[0], "then", self.block_exp[1], "if")
+            self.__parse_tree = tuple(parse_tree)
+
+        return self.__parse_tree
+
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"if"})
     PARSABLE_ERROR_NAME = "if statement"
 
     @classmethod
@@ -548,17 +569,17 @@ class IfNode(AstNode, Parsable):
         block_exp_list: list[tuple[BlockNode, data_nodes.ExpNode]] = []
         else_block_node = None
 
-        (tmp_exp, tmp_block) = parser.parse_simple_rule(
-            (data_nodes.ExpNode, "then", BlockNode), next(stream).content
-        )
+        tmp_exp = parser.parse_closed(data_nodes.ExpNode, "then", next(stream).content)
+        tmp_block = parser.parse_parsable(BlockNode, "then", True)
 
         block_exp: tuple[BlockNode, data_nodes.ExpNode] = (tmp_block, tmp_exp)
 
         # parse {elseif exp then block}
         while stream.peek().content == "elseif":
-            (tmp_exp, tmp_block) = parser.parse_simple_rule(
-                (data_nodes.ExpNode, "then", BlockNode), next(stream).content
+            tmp_exp = parser.parse_closed(
+                data_nodes.ExpNode, "then", next(stream).content
             )
+            tmp_block = parser.parse_parsable(BlockNode, "then", True)
             block_exp_list.append((tmp_block, tmp_exp))
 
         # parse [else block]
@@ -579,25 +600,29 @@ class EmptyNode(AstNode, Parsable):
     __slots__ = ()
 
     def parse_tree_descendants(self):
-        return iter((";",))
+        return (";",)
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {";"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({";"})
     PARSABLE_ERROR_NAME = "';' statement"
 
 
 class RetNode(AstNode, Parsable):
-    __slots__ = ("exp_node_list",)
+    __slots__ = "exp_node_list", "__parse_tree"
 
     def __init__(self, exp_node_list: list[data_nodes.ExpNode]) -> None:
         self.exp_node_list = exp_node_list
+        self.__parse_tree: tuple[AstNode | str, ...] | None = None
 
     def descendants(self):
         return reversed(self.exp_node_list)
 
     def parse_tree_descendants(self):
-        return chain(iter_sep(reversed(self.exp_node_list)), ("return",))
+        if self.__parse_tree is None:
+            self.__parse_tree = (*iter_sep(reversed(self.exp_node_list)), "return")
+
+        return self.__parse_tree
 
-    PARSABLE_FIRST_TOKEN_CONTENTS = {"return"}
+    PARSABLE_FIRST_TOKEN_CONTENTS = frozenset({"return"})
     PARSABLE_ERROR_NAME = "return statement"
 
     @classmethod
@@ -655,28 +680,34 @@ class BlockNode(AstNode, Parsable):
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
         stream = parser.token_stream
+        peek = stream.peek
+        parse_parsable = parser.parse_parsable
         statement_node_list: list[AstNode] = []
+        append_statement = statement_node_list.append
+        statement_by_key = cls._D_T_STATEMENTS.flat.get
 
         while True:
-            match cls._D_T_STATEMENTS[stream.peek()]:
-                case None:
-                    break
-
-                case list() as possible_candidates:
-                    for candidate in possible_candidates[:-1]:
-                        if candidate.parsable_presented_in_stream(stream):
-                            statement_node_list.append(parser.parse_parsable(candidate))
-                            break
-                    else:
-                        statement_node_list.append(
-                            parser.parse_parsable(possible_candidates[-1])
-                        )
+            statement = statement_by_key(peek().dispatch_key)
+
+            if statement is None:
+                break
+
+            if type(statement) is list:
+                # last candidate is parsed without check
+                last_candidate = statement[-1]
+                for candidate in statement:
+                    if (
+                        candidate is last_candidate
+                        or candidate.parsable_presented_in_stream(stream)
+                    ):
+                        append_statement(parse_parsable(candidate))
+                        break
 
-                case p:
-                    statement_node_list.append(parser.parse_parsable(p))
+            else:
+                append_statement(parse_parsable(statement))
 
-                    if p == RetNode:
-                        break
+                if statement is RetNode:
+                    break
 
         return cls(statement_node_list)
 
@@ -697,10 +728,10 @@ class ChunkNode(AstNode, Parsable):
         self.block_node = block_node
 
     def descendants(self):
-        return iter((self.block_node,))
+        return (self.block_node,)
 
     def parse_tree_descendants(self):
-        return iter((self.block_node,))
+        return (self.block_node,)
 
     @classmethod
     def parsable_from_parser(cls, parser: LuaParser) -> Self:
@@ -35,9 +35,13 @@ class WrongTokenError(Exception):
     ):
         self.err_content = err_content
         self.err_file_offset = err_file_offset
-        self.__explanation = f"{err_name} expected"
-        if prev_err_name:
-            self.__explanation += f" after {prev_err_name}"
+        self.err_name = err_name
+        self.prev_err_name = prev_err_name
 
+    # message is formatted only when it is actually shown
     def __str__(self):
-        return f"wrong token: '{self.err_content}' but {self.__explanation}"
+        explanation = f"{self.err_name} expected"
+        if self.prev_err_name:
+            explanation += f" after {self.prev_err_name}"
+
+        return f"wrong token: '{self.err_content}' but {explanation}"
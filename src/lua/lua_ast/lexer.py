@@ -3,18 +3,26 @@ This module provides everything connected with lexical structure of lua
 """
 
 import re
+from sys import intern
 from dataclasses import dataclass
-from collections import deque
-from collections.abc import Iterator
+from collections.abc import Iterable, Iterator
 
 from lua.lua_ast.exceptions import UnexpectedSymbolError
 
+# tokens with bounded vocabulary, their contents are compared against
+# dispatch tables all the time so they share one interned string each
+_INTERNED_TOKEN_NAMES = frozenset(("keyword", "other", "op", "dot", "punct"))
 
-@dataclass(eq=True, frozen=True)
+
+# tokens are never hashed, plain slots make construction and reads cheaper
+@dataclass(slots=True)
 class Token:
     name: str
     content: str
     pos: int
+    # what dispatch tables look token up by: contents of tokens with
+    # bounded vocabulary and names of the others, so the two never clash
+    dispatch_key: str
 
 
 @dataclass
@@ -27,45 +35,66 @@ class TokenPattern:
 class BufferedTokenStream:
     """iterator that returns tokens and supports lookahead for n tokens"""
 
-    def __init__(self, txt: str, pattern: str, skip_table: dict[str, bool]) -> None:
-        self.__content = txt
-        self.__iter = re.finditer(pattern, self.__content)
-        self.__skip_table = skip_table
-        self.__buffer: deque = deque()
-
-    def __get_token(self) -> Token:
-        while True:
-            match = next(self.__iter)
+    def __init__(
+        self, txt: str, pattern: re.Pattern[str], skip_names: frozenset[str]
+    ) -> None:
+        self.__tokens: list[Token] = []
+        self.__pos = 0
+        # position of opening brace: position after its closing brace,
+        # filled on first lookahead of braced construction
+        self.__brace_ends: dict[int, int] | None = None
+        # raised when stream is read past the last token
+        self.__tail_error: Exception = StopIteration()
+
+        # the whole text is tokenized in one pass, lexical error is
+        # postponed until the parser actually reaches it
+        append = self.__tokens.append
+        for match in pattern.finditer(txt):
+            if (matched_target := match.lastgroup) in skip_names:
+                continue
 
-            if (matched_target := match.lastgroup) is None:
-                raise UnexpectedSymbolError(match.group(0), match.span()[0])
+            if matched_target is None:
+                self.__tail_error = UnexpectedSymbolError(
+                    match.group(0), match.start()
+                )
+                break
 
-            if self.__skip_table[matched_target]:
-                continue
+            content = match.group(matched_target)
+            if matched_target in _INTERNED_TOKEN_NAMES:
+                content = key = intern(content)
+            else:
+                key = matched_target
 
-            return Token(matched_target, match.group(matched_target), match.span()[0])
+            append(Token(matched_target, content, match.start(), key))
 
     def __iter__(self):
         return self
 
     def __next__(self) -> Token:
-        if not self.__buffer:
-            return self.__get_token()
+        pos = self.__pos
+
+        try:
+            t = self.__tokens[pos]
+        except IndexError:
+            raise self.__tail_error from None
+
+        self.__pos = pos + 1
+        return t
 
-        return self.__buffer.popleft()
+    def advance(self, k: int = 1) -> None:
+        """skips k tokens"""
+
+        self.__pos += k
 
     def peek(self, k: int = 0) -> Token:
         """used to lookahead for k symbols
         does not change the iterator state
         """
 
-        if k < len(self.__buffer):
-            return self.__buffer[k]
-
-        while len(self.__buffer) <= k:
-            self.__buffer.append(self.__get_token())
-
-        return self.__buffer[k]
+        try:
+            return self.__tokens[self.__pos + k]
+        except IndexError:
+            raise self.__tail_error from None
 
     def peek_matching_parenthesis(self, start: str, stop: str, index: int = 0) -> int:
         """used to lookahead the braced constructions like '(' exp ')'
@@ -74,25 +103,57 @@ class BufferedTokenStream:
         return index of last equal closing brace symbol
         """
 
-        if (sym := self.peek(index).content) == start:
-            stack = [
-                sym,
-            ]
-            while stack:
-                index += 1
-                t = self.peek(index)
-                sym = t.content
-                if sym == start:
-                    stack.append(sym)
-                elif sym == stop:
-                    stack.pop()
-                elif t.name == "EOF":
-                    return index
-
-            return index + 1
+        if self.peek(index).content == start:
+            if self.__brace_ends is None:
+                self.__brace_ends = self.__match_braces()
+
+            pos = self.__pos
+            # braces left open up to the end of tokens without EOF
+            # are cut by lexical error
+            if (end := self.__brace_ends.get(pos + index)) is None:
+                raise self.__tail_error
+
+            return end - pos
 
         return index
 
+    def __match_braces(self) -> dict[int, int]:
+        """match every brace in one pass so lookahead does not rescan
+        nested constructions, each kind of braces is matched separately
+        """
+
+        brace_ends: dict[int, int] = {}
+        open_braces: dict[str, list[int]] = {"(": [], "[": [], "{": []}
+        closing_braces = {
+            ")": open_braces["("],
+            "]": open_braces["["],
+            "}": open_braces["{"],
+        }
+
+        for i, t in enumerate(self.__tokens):
+            sym = t.content
+            if (opened := open_braces.get(sym)) is not None:
+                opened.append(i)
+            elif (opened := closing_braces.get(sym)) is not None:
+                if opened:
+                    brace_ends[opened.pop()] = i + 1
+            elif t.name == "EOF":
+                # unclosed braces end on EOF
+                for opened in open_braces.values():
+                    brace_ends |= dict.fromkeys(opened, i)
+
+        return brace_ends
+
+
+# escape sequence inside short strings
+_ESCAPE_SEQUENCE = (
+    r"""\\(?:[abfnrtvz\\"']|x[a-fA-F0-9]{2}|[0-9]{1,3}|u\{[a-fA-F0-9]+\}|\n\s*)"""
+)
+
+
+# terminals ending with these symbols can be concatenated without space
+_CONCAT_SYMS = frozenset("+-*/%^#&~|<>=(){}[]:;,.'\"")
+
 
 class LuaLexer:
     """singleton class representing lua lexical rules"""
@@ -101,7 +162,7 @@ class LuaLexer:
         TokenPattern("delimeter", r"[\s\n\r]+", ignore=True),
         TokenPattern(
             "comment",
-            r"--(?:\[(?P<_eq>=*)\[[\s\S]*\](?P=_eq)\]|\n|[^[].*)",
+            r"--(?:\[(?P<_eq>=*)\[[\s\S]*?\](?P=_eq)\]|\n|[^[].*)",
             ignore=True,
         ),
         TokenPattern(
@@ -113,36 +174,33 @@ class LuaLexer:
         TokenPattern("dot", r"\."),
         TokenPattern(
             "string",
-            r'"(?:[^"\\\n]|' +
-            # escape sequence regex
-            r"""\\(?:[abfnrtvz\\"']|x[a-fA-F0-9]{2}|[0-9]{1,3}|u{[a-fA-F0-9]+}|\n\s*)"""
-            + r""")*"|'(?:[^'\\\n]|"""
-            +
-            # escape sequence regex
-            r"""\\(?:[abfnrtvz\\"']|x[a-fA-F0-9]{2}|[0-9]{1,3}|u{[a-fA-F0-9]+}|\n\s*)"""
-            + r")*'|(?:\[(?P<eq_sign>=*)\[[\s\S]*\](?P=eq_sign)\])",
+            rf'"(?:[^"\\\n]|{_ESCAPE_SEQUENCE})*"'
+            + rf"|'(?:[^'\\\n]|{_ESCAPE_SEQUENCE})*'"
+            + r"|\[(?P<eq_sign>=*)\[[\s\S]*?\](?P=eq_sign)\]",
         ),
         TokenPattern("punct", r"[(){}\[\];,]"),
+        # numerals are split by type here so parser does not rescan them
         TokenPattern(
-            "numeral",
-            r"-?(?:" +
-            # hex num regex
-            r"0[xX][a-fA-F0-9]+(?:\.[a-fA-F0-9]+)?(?:[pPeE][+-]?[a-fA-F0-9]+)?"
-            + ")|(?:"
-            +
+            "numeral_float",
+            # hex num regex, digits are possessive since 'e' is a hex digit too
+            r"0[xX][a-fA-F0-9]++"
+            + r"(?:\.[a-fA-F0-9]+(?:[pPeE][+-]?[a-fA-F0-9]+)?|[pPeE][+-]?[a-fA-F0-9]+)"
             # dec num regex
-            r"[0-9]+(?:\.[0-9]+)?(?:[pPeE][+-]?[0-9]+)?" + ")",
+            + r"|[0-9]+(?:\.[0-9]+(?:[pPeE][+-]?[0-9]+)?|[pPeE][+-]?[0-9]+)",
         ),
+        TokenPattern("numeral_int", r"0[xX][a-fA-F0-9]+|[0-9]+"),
         TokenPattern("id", r"[A-Za-z_]\w*"),
         TokenPattern("EOF", r"\Z"),
     )
 
     def __init__(self):
-        self.__final_pattern = (
+        self.__final_pattern = re.compile(
             "|".join([f"(?P<{t.name}>{t.pattern})" for t in self.LUA_TOKEN_PATTERNS])
             + r"|."
         )
-        self.__skip_names = {t.name: t.ignore for t in self.LUA_TOKEN_PATTERNS}
+        self.__skip_names = frozenset(
+            t.name for t in self.LUA_TOKEN_PATTERNS if t.ignore
+        )
 
     def create_buffered_stream(self, txt: str) -> BufferedTokenStream:
         """create token iterator from text string"""
@@ -150,38 +208,12 @@ class LuaLexer:
         return BufferedTokenStream(txt, self.__final_pattern, self.__skip_names)
 
     @staticmethod
-    def concat(term_iter: Iterator[str]) -> Iterator[str]:
+    def concat(terms: Iterable[str]) -> Iterator[str]:
         """puts spaces where its necessary between terms recieved from ast iterator
         some terms in lua should be separated by space like 'local function'
         """
-        concat_syms = {
-            "+",
-            "-",
-            "*",
-            "/",
-            "%",
-            "^",
-            "#",
-            "&",
-            "~",
-            "|",
-            "<",
-            ">",
-            "=",
-            "(",
-            ")",
-            "{",
-            "}",
-            "[",
-            "]",
-            ":",
-            ";",
-            ",",
-            ".",
-            "'",
-            '"',
-        }
-
+        concat_syms = _CONCAT_SYMS
+        term_iter = iter(terms)
         prev_terminal = next(term_iter, None)
 
         if prev_terminal is None:
@@ -190,17 +222,16 @@ class LuaLexer:
 
         yield prev_terminal
 
-        concat = prev_terminal[-1] in concat_syms
+        # only last symbols of terminals are compared
+        prev_sym = prev_terminal[-1]
+        concat = prev_sym in concat_syms
 
         for terminal in term_iter:
-            new_concat = terminal[-1] in concat_syms
-            if (
-                not (concat or new_concat)
-                or prev_terminal[-1] == "."
-                and terminal[-1] == "."
-            ):
+            sym = terminal[-1]
+            new_concat = sym in concat_syms
+            if not (concat or new_concat) or prev_sym == "." and sym == ".":
                 yield " "
 
             yield terminal
             concat = new_concat
-            prev_terminal = terminal
+            prev_sym = sym
@@ -4,13 +4,14 @@ This module provides basic approaches to parsing lua abstract syntax tree nodes
 
 from __future__ import annotations
 from collections.abc import Generator, KeysView, Callable
+from sys import intern
 from typing import Any, TypeVar
 
 from lua.lua_ast.lexer import LuaLexer, Token, BufferedTokenStream
 from lua.lua_ast.exceptions import WrongTokenError
 
 
-ParsableFirstTokenType = set[str] | KeysView[str]
+ParsableFirstTokenType = set[str] | frozenset[str] | KeysView[str]
 
 T = TypeVar("T", bound="Parsable")
 
@@ -25,17 +26,32 @@ class Parsable:
             object this name will be printed in message
         PARSABLE_MARK_POS -- ask parser to remember position of first token
             of this object in file
+        PARSABLE_TOKENS_NUM -- number of tokens skipped by default
+            parsable_from_parser, so objects consisting of fixed tokens
+            do not need to override it
     """
 
-    PARSABLE_FIRST_TOKEN_CONTENTS: ParsableFirstTokenType = set()
-    PARSABLE_FIRST_TOKEN_NAMES: ParsableFirstTokenType = set()
+    PARSABLE_FIRST_TOKEN_CONTENTS: ParsableFirstTokenType = frozenset()
+    PARSABLE_FIRST_TOKEN_NAMES: ParsableFirstTokenType = frozenset()
 
     PARSABLE_ERROR_NAME: str = ""
 
     PARSABLE_MARK_POS: bool = False
 
+    PARSABLE_TOKENS_NUM: int = 1
+
     __slots__ = ()
 
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+
+        # lexer interns token contents, interned FIRST sets let
+        # membership tests succeed on identity comparison
+        if "PARSABLE_FIRST_TOKEN_CONTENTS" in cls.__dict__:
+            cls.PARSABLE_FIRST_TOKEN_CONTENTS = frozenset(
+                map(intern, cls.PARSABLE_FIRST_TOKEN_CONTENTS)
+            )
+
     @classmethod
     def parsable_from_parser(cls: type[T], parser: LuaParser) -> T:
         """this method should construct node from parser.token_stream
@@ -43,7 +59,7 @@ class Parsable:
         should be called only when one can guarantee that it will get right first token
         """
 
-        next(parser.token_stream)
+        parser.token_stream.advance(cls.PARSABLE_TOKENS_NUM)
         return cls()
 
     @classmethod
@@ -71,6 +87,8 @@ class ParsableSkipable(Parsable):
     can be called directly during parsing
     """
 
+    __slots__ = ()
+
     @classmethod
     def parsable_skip_in_stream(cls, stream: BufferedTokenStream, index: int) -> int:
         """skip enought tokens in stream to skip the node that can be parsed from them"""
@@ -80,6 +98,10 @@ class ParsableSkipable(Parsable):
 ParsableType = type[Parsable]
 
 
+# identical FIRST_TOKEN sets made by parsable_starts_with share one object
+_FIRST_TOKEN_SETS: dict[frozenset[str], frozenset[str]] = {}
+
+
 def parsable_starts_with(
     *starting_nonterms: ParsableType,
 ) -> Callable[[ParsableType], ParsableType]:
@@ -88,26 +110,21 @@ def parsable_starts_with(
     """
 
     def decorate(orig_class: ParsableType):
+        contents = set(orig_class.PARSABLE_FIRST_TOKEN_CONTENTS)
+        names = set(orig_class.PARSABLE_FIRST_TOKEN_NAMES)
+
         for nonterm_class in starting_nonterms:
-            # I guess sometimes we can just link
-            # to a existing set without creating a copy
-            if not orig_class.PARSABLE_FIRST_TOKEN_CONTENTS:
-                orig_class.PARSABLE_FIRST_TOKEN_CONTENTS = (
-                    nonterm_class.PARSABLE_FIRST_TOKEN_CONTENTS
-                )
-            elif nonterm_class.PARSABLE_FIRST_TOKEN_CONTENTS:
-                orig_class.PARSABLE_FIRST_TOKEN_CONTENTS |= (
-                    nonterm_class.PARSABLE_FIRST_TOKEN_CONTENTS
-                )
+            contents |= nonterm_class.PARSABLE_FIRST_TOKEN_CONTENTS
+            names |= nonterm_class.PARSABLE_FIRST_TOKEN_NAMES
 
-            if not orig_class.PARSABLE_FIRST_TOKEN_NAMES:
-                orig_class.PARSABLE_FIRST_TOKEN_NAMES = (
-                    nonterm_class.PARSABLE_FIRST_TOKEN_NAMES
-                )
-            elif nonterm_class.PARSABLE_FIRST_TOKEN_NAMES:
-                orig_class.PARSABLE_FIRST_TOKEN_NAMES |= (
-                    nonterm_class.PARSABLE_FIRST_TOKEN_NAMES
-                )
+        frozen_contents = frozenset(contents)
+        frozen_names = frozenset(names)
+        orig_class.PARSABLE_FIRST_TOKEN_CONTENTS = _FIRST_TOKEN_SETS.setdefault(
+            frozen_contents, frozen_contents
+        )
+        orig_class.PARSABLE_FIRST_TOKEN_NAMES = _FIRST_TOKEN_SETS.setdefault(
+            frozen_names, frozen_names
+        )
 
         return orig_class
 
@@ -131,11 +148,13 @@ def _dict_add_duplicates(src: dict, keys: ParsableFirstTokenType, value: Any):
 class TokenDispatchTable:
     """dispatch other objects depending on token"""
 
-    __slots__ = "contents", "names"
+    __slots__ = "contents", "names", "flat"
 
     def __init__(self, contents: dict[str, Any], names: dict[str, Any]) -> None:
         self.contents = contents
         self.names = names
+        # keyed by Token.dispatch_key, one lookup per token
+        self.flat = contents | names
 
     @classmethod
     def dispatch_types(cls, *parsable_classes: ParsableType):
@@ -155,10 +174,10 @@ class TokenDispatchTable:
         return cls(contents, names)
 
     def __contains__(self, token: Token) -> bool:
-        return token.content in self.contents or token.name in self.names
+        return token.dispatch_key in self.flat
 
     def __getitem__(self, token: Token) -> Any:
-        return self.names.get(token.name, self.contents.get(token.content))
+        return self.flat.get(token.dispatch_key)
 
 
 class LuaParser:
@@ -218,7 +237,7 @@ class LuaParser:
     def parse_list(
         self,
         parsable_type: type[T],
-        separators: set[str] = {","},
+        separators: set[str] | frozenset[str] = frozenset((",",)),
         non_empty: bool = False,
         error_name: str = "",
         greedy: bool = False,
@@ -254,6 +273,32 @@ class LuaParser:
                     t.content, t.pos, parsable_type.PARSABLE_ERROR_NAME, error_name
                 )
 
+    def parse_closed(
+        self,
+        parsable_type: type[T],
+        closing: str,
+        error_name: str = "",
+    ) -> T:
+        """used to parse rule nonterm terminal
+        same as parse_simple_rule((parsable_type, closing)) without generic loop
+        """
+        res = self.parse_parsable(parsable_type, error_name, True)
+        self.parse_terminal(closing, parsable_type.PARSABLE_ERROR_NAME)
+        return res
+
+    def parse_enclosed(
+        self,
+        opening: str,
+        parsable_type: type[T],
+        closing: str,
+        error_name: str = "",
+    ) -> T:
+        """used to parse rule terminal nonterm terminal
+        same as parse_simple_rule((opening, parsable_type, closing)) without loop
+        """
+        self.parse_terminal(opening, error_name)
+        return self.parse_closed(parsable_type, closing, opening)
+
     def parse_simple_rule(
         self,
         rule: tuple[ParsableType | str, ...],
@@ -1,12 +1,15 @@
-from collections.abc import Iterator
+from collections.abc import Iterable
 from typing import Any
 
 
-def iter_sep(seq: Iterator[Any], sep: Any = ","):
-    """insert sep after each value from seq"""
+def iter_sep(seq: Iterable[Any], sep: Any = ",") -> list[Any]:
+    """insert sep between values from seq"""
 
-    if (t := next(seq, None)) is not None:
-        yield t
-        for j in seq:
-            yield sep
-            yield j
+    items = list(seq)
+    if not items:
+        return items
+
+    # interleave with slice assignment instead of yielding value by value
+    result = [sep] * (2 * len(items) - 1)
+    result[::2] = items
+    return result
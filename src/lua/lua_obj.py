@@ -17,8 +17,11 @@ class LuaObject:
             self.ast_chunk: ChunkNode = LuaParser(code).parse_parsable(ChunkNode)
         except (UnexpectedSymbolError, WrongTokenError) as e:
             line_num = code.count("\n", 0, e.err_file_offset) + 1
-            row_num = e.err_file_offset - code[: e.err_file_offset].rfind("\n")
-            line = code.split("\n")[line_num - 1]
+            line_start = code.rfind("\n", 0, e.err_file_offset) + 1
+            row_num = e.err_file_offset - line_start + 1
+            if (line_end := code.find("\n", e.err_file_offset)) == -1:
+                line_end = len(code)
+            line = code[line_start:line_end]
             raise ParsingError(
                 (line_num, row_num, len(e.err_content)), line, str(e)
             ) from e
@@ -17,6 +17,9 @@ from lua import LuaObject, ParsingError
 
 APP_MAIN_BG = "#2b2b2b"
 
+# every symbol except tabs is blanked under error line
+_ERR_UNDERLINE_PATTERN = re.compile("[^\t ]")
+
 
 def run_app():
     """simple gui tkinter app"""
@@ -171,7 +174,7 @@ def run_app():
             result = (
                 e.err_line
                 + "\n"
-                + re.sub("[^\t ]", " ", e.err_line[: e.file_pos[1] - 1])
+                + _ERR_UNDERLINE_PATTERN.sub(" ", e.err_line[: e.file_pos[1] - 1])
                 + "^" * e.file_pos[2]
                 + "\n"
                 + str(e)